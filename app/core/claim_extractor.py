@@ -6,13 +6,18 @@ Uses Spacy for sentence segmentation and KeyBERT for keyword extraction.
 Models are lazy-loaded via model_registry to prevent import-time memory allocation.
 """
 
-from trafilatura import fetch_url, extract
+from trafilatura import extract
+from app.core.scraper import fetch_html
 import nltk
+import re
 import logging
 from typing import Optional, Tuple, List
 
 logger = logging.getLogger(__name__)
 
+# Any run of whitespace (spaces, tabs, newlines) collapses to one space
+_WS_RE = re.compile(r"\s+")
+
 # Download required NLTK data (lightweight, ~5MB)
 try:
     nltk.data.find('tokenizers/punkt')
@@ -25,6 +30,9 @@ def extract_text_from_url(url: str) -> str:
     """
     Fetch and clean article content from a URL.
     
+    The page is fetched over the scraper's pooled HTTP/2 client and read
+    up to scraper.MAX_HTML_BYTES (see fetch_html).
+    
     Args:
         url: The URL of the article to extract text from
         
@@ -32,7 +40,7 @@ def extract_text_from_url(url: str) -> str:
         Cleaned article text, or empty string if extraction fails
     """
     try:
-        html = fetch_url(url)
+        html = fetch_html(url)
         if not html:
             logger.warning(f"Failed to fetch HTML from {url}")
             return ""
@@ -47,80 +55,83 @@ def clean_text(text: str) -> str:
     """Normalize whitespace and formatting."""
     if not text:
         return ""
-    return " ".join(text.split())
+    return _WS_RE.sub(" ", text).strip()
 
 
-def score_sentence_importance(sentence: str, doc) -> float:
+def score_sentence_importance(sentence, sent_ents) -> float:
     """
     Score sentence importance based on multiple factors.
     
     Args:
-        sentence: The sentence to score
-        doc: The spacy doc containing entities
+        sentence: The sentence span to score (from doc.sents)
+        sent_ents: Named entity spans inside the sentence (sentence.ents)
         
     Returns:
         Importance score (higher = more important)
     """
-    from app.core.model_registry import get_spacy_nlp
-    nlp = get_spacy_nlp()
-    
+    text = sentence.text.strip()
     score = 0.0
     
     # Contains named entities (+2 per entity type)
-    sentence_ents = [ent for ent in doc.ents if ent.text in sentence]
-    score += len(set(ent.label_ for ent in sentence_ents)) * 2.0
+    score += len(set(ent.label_ for ent in sent_ents)) * 2.0
     
-    # Contains numbers/statistics (+1)
-    sentence_doc = nlp(sentence)
-    if any(tok.like_num for tok in sentence_doc):
+    # Contains numbers/statistics (+1) - reuse the already-parsed tokens
+    if any(tok.like_num for tok in sentence):
         score += 1.0
     
     # Good length: not too short, not too long (+1)
-    if 30 < len(sentence) < 200:
+    if 30 < len(text) < 200:
         score += 1.0
     
     # Contains quotation marks (likely a claim) (+1.5)
-    if '"' in sentence or "'" in sentence:
+    if '"' in text or "'" in text:
         score += 1.5
     
     return score
 
 
-def extract_claim_from_text(text: str) -> Tuple[str, List[str]]:
+def extract_claim_with_entities(text: str) -> Tuple[str, List[str], Optional[List[str]]]:
     """
     Extracts the main claim by choosing the most important sentence.
     Uses sentence importance scoring instead of always taking the first sentence.
-    Also extracts keywords using KeyBERT for enhanced query generation.
+    Also extracts keywords using KeyBERT for enhanced query generation, and
+    returns the claim's named entities from the same spaCy pass so query
+    generation does not need to re-run NER on the claim.
     
     Args:
         text: The article text to extract claim from
         
     Returns:
-        Tuple of (claim_sentence, keywords_list)
+        Tuple of (claim_sentence, keywords_list, entities_list). entities_list
+        is None when no sentence was scored (fallback claim), so query
+        generation runs its own NER instead of treating it as "no entities"
     """
     from app.core.model_registry import get_spacy_nlp, get_keybert_model
     
     text = clean_text(text)
     if not text:
-        return "", []
+        return "", [], None
 
     nlp = get_spacy_nlp()
     doc = nlp(text[:5000])
-    sentences = [sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 20]
+    sent_objs = [sent for sent in doc.sents if len(sent.text.strip()) > 20][:10]
 
-    if not sentences:
-        return text[:500], []
+    if not sent_objs:
+        return text[:500], [], None
 
     # Score each sentence for importance
     scored_sentences = []
-    for idx, sent in enumerate(sentences[:10]):
-        score = score_sentence_importance(sent, doc)
+    for idx, sent in enumerate(sent_objs):
+        # Span.ents selects entities by token offsets, no substring search
+        score = score_sentence_importance(sent, sent.ents)
         position_bonus = max(0, 3 - idx) * 0.5
         total_score = score + position_bonus
         scored_sentences.append((sent, total_score))
     
     scored_sentences.sort(key=lambda x: x[1], reverse=True)
-    claim = scored_sentences[0][0]
+    claim_span = scored_sentences[0][0]
+    claim = claim_span.text.strip()
+    entities = [ent.text for ent in claim_span.ents]
 
     # Extract keywords using KeyBERT
     try:
@@ -136,4 +147,19 @@ def extract_claim_from_text(text: str) -> Tuple[str, List[str]]:
         logger.warning(f"KeyBERT extraction failed: {e}")
         keywords = []
 
-    return claim, keywords
\ No newline at end of file
+    return claim, keywords, entities
+
+
+def extract_claim_from_text(text: str) -> Tuple[str, List[str]]:
+    """
+    Extracts the main claim and its keywords from article text.
+    (Backwards compatible wrapper)
+    
+    Args:
+        text: The article text to extract claim from
+        
+    Returns:
+        Tuple of (claim_sentence, keywords_list)
+    """
+    claim, keywords, _ = extract_claim_with_entities(text)
+    return claim, keywords
@@ -7,30 +7,57 @@ Converts text to 384-dimensional vectors (MiniLM) and compares using cosine simi
 Accuracy improvements:
 - Returns top-N matching sentences (not just top-1)
 - LRU cache for claim embeddings
+
+Performance:
+- Embeddings L2-normalized once, so cosine similarity is a single mat-vec
+- NumPy embeddings on CPU (BLAS sgemv, no tensor <-> list round trips)
+- np.argpartition top-N instead of a Python sort over all scores
+- One batched encode across all evidence sources
+- Near-duplicate pruning of texts (search queries) by embedding similarity
 """
 
-from sentence_transformers import util
+import numpy as np
 from functools import lru_cache
 import logging
 from typing import Tuple, List, Optional
-import hashlib
 
 logger = logging.getLogger(__name__)
 
 
 # LRU cache for claim embeddings (bounded to 32 entries)
 @lru_cache(maxsize=32)
-def _encode_claim_cached(claim_hash: str, claim: str):
-    """Cache claim embeddings by hash to avoid re-encoding same claims."""
+def encode_claim(claim: str):
+    """Get cached claim embedding (L2-normalized, read-only)."""
     from app.core.model_registry import get_sbert_model
     sbert_model = get_sbert_model()
-    return sbert_model.encode(claim, convert_to_tensor=True)
-
-
-def encode_claim(claim: str):
-    """Get cached claim embedding."""
-    claim_hash = hashlib.md5(claim.encode()).hexdigest()
-    return _encode_claim_cached(claim_hash, claim)
+    # Normalize once at cache time so similarity is a plain dot product
+    emb = np.asarray(
+        sbert_model.encode(claim, convert_to_numpy=True, normalize_embeddings=True),
+        dtype=np.float32
+    )
+    # The array is shared by every cache hit
+    emb.setflags(write=False)
+    return emb
+
+
+def _encode_normalized(sbert_model, sentences: List[str], batch_size: int) -> np.ndarray:
+    """Encode sentences to an (N, dim) float32 array of unit vectors."""
+    return np.asarray(
+        sbert_model.encode(
+            sentences, convert_to_numpy=True, normalize_embeddings=True, batch_size=batch_size
+        ),
+        dtype=np.float32
+    )
+
+
+def _top_n_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the top_n highest scores, best first (O(N) selection)."""
+    k = min(top_n, len(scores))
+    if k < len(scores):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx], kind="stable")]
 
 
 def get_best_matching_sentences(
@@ -49,30 +76,61 @@ def get_best_matching_sentences(
     Returns:
         List of (sentence, similarity_score) tuples, sorted by score descending
     """
+    return get_best_matching_sentences_batch(claim, [sentences], top_n=top_n, batch_size=32)[0]
+
+
+def get_best_matching_sentences_batch(
+    claim: str,
+    sentence_groups: List[List[str]],
+    top_n: int = 3,
+    batch_size: int = 64
+) -> List[List[Tuple[str, float]]]:
+    """
+    Find the top N matching sentences for several groups (e.g. one per
+    source article) with a single SBERT encode over all sentences.
+    
+    Args:
+        claim: The claim to fact-check
+        sentence_groups: One list of candidate sentences per group
+        top_n: Number of top matches to return per group
+        batch_size: SBERT encode batch size
+        
+    Returns:
+        One list of (sentence, similarity_score) tuples per group, aligned
+        with sentence_groups and sorted by score descending
+    """
     from app.core.model_registry import get_sbert_model
     
-    if not sentences:
-        return []
+    all_sentences = [sent for group in sentence_groups for sent in group]
+    if not all_sentences:
+        return [[] for _ in sentence_groups]
 
     sbert_model = get_sbert_model()
     
     # Use cached claim embedding
     claim_emb = encode_claim(claim)
-    sent_embs = sbert_model.encode(sentences, convert_to_tensor=True, batch_size=32)
-
-    # Compute cosine similarity
-    cosine_scores = util.pytorch_cos_sim(claim_emb, sent_embs)[0]
-
-    # Convert to Python list
-    scores_list = cosine_scores.cpu().tolist()
-
-    # Create list of (sentence, score) tuples
-    scored_sentences = list(zip(sentences, scores_list))
-    
-    # Sort by score descending and return top N
-    scored_sentences.sort(key=lambda x: x[1], reverse=True)
+    sent_embs = _encode_normalized(sbert_model, all_sentences, batch_size)
+
+    # Cosine similarity of unit vectors is a single mat-vec
+    cosine_scores = sent_embs @ claim_emb
+
+    # Top N per group by slicing the flat score vector at group offsets
+    results = []
+    start = 0
+    for group in sentence_groups:
+        end = start + len(group)
+        if end == start:
+            results.append([])
+            continue
+        group_scores = cosine_scores[start:end]
+        top_idx = _top_n_indices(group_scores, top_n)
+        results.append([
+            (group[idx], score)
+            for idx, score in zip(top_idx.tolist(), group_scores[top_idx].tolist())
+        ])
+        start = end
     
-    return scored_sentences[:top_n]
+    return results
 
 
 def get_best_matching_sentence(
@@ -102,13 +160,13 @@ def get_best_matching_sentence(
     
     # Use cached claim embedding
     claim_emb = encode_claim(claim)
-    sent_embs = sbert_model.encode(sentences, convert_to_tensor=True, batch_size=32)
+    sent_embs = _encode_normalized(sbert_model, sentences, 32)
 
-    # Compute cosine similarity
-    cosine_scores = util.pytorch_cos_sim(claim_emb, sent_embs)[0]
+    # Cosine similarity of unit vectors is a single mat-vec
+    cosine_scores = sent_embs @ claim_emb
 
     # Convert to Python list
-    scores_list = cosine_scores.cpu().tolist()
+    scores_list = cosine_scores.tolist()
 
     # Get index of highest match
     best_idx = scores_list.index(max(scores_list))
@@ -117,3 +175,40 @@ def get_best_matching_sentence(
     best_score = scores_list[best_idx]
 
     return best_sentence, best_score, scores_list
+
+
+def prune_near_duplicates(
+    texts: List[str],
+    threshold: float = 0.9,
+    protected: int = 0
+) -> List[str]:
+    """
+    Drop texts that are near-duplicates of another text by embedding similarity.
+    
+    Texts are considered shortest first, so the shortest member of each
+    near-duplicate cluster is the one kept.
+    
+    Args:
+        texts: Candidate texts (e.g. search queries)
+        threshold: Cosine similarity at or above which two texts are duplicates
+        protected: Number of leading texts that are always kept
+        
+    Returns:
+        The kept texts, in their original order
+    """
+    from app.core.model_registry import get_sbert_model
+    
+    if len(texts) <= max(protected, 1):
+        return list(texts)
+    
+    sbert_model = get_sbert_model()
+    embs = _encode_normalized(sbert_model, texts, 32)
+    sims = (embs @ embs.T).tolist()
+    
+    kept = list(range(protected))
+    candidates = sorted(range(protected, len(texts)), key=lambda i: len(texts[i]))
+    for i in candidates:
+        if all(sims[i][j] < threshold for j in kept):
+            kept.append(i)
+    
+    return [texts[i] for i in sorted(kept)]
@@ -7,13 +7,23 @@ Accuracy improvements applied:
 - Multi-sentence evidence (top-3 sentences per source)
 - Reduced spaCy processing limit 50k→10k
 - Sentence limit for SBERT encoding
+- Sentence splitting uses a sentencizer-only spaCy pipeline
+
+Performance:
+- Article fetches fan out concurrently on one asyncio event loop (httpx);
+  only CPU-bound work (extraction, spaCy, SBERT, NLI) uses worker threads
+- Sentences from all sources are embedded in a single SBERT encode
+- Stance candidates from all sources go through one batched NLI call
+- prepare_claim() embeds the claim and readies the NLI inputs while the
+  web search is still in flight
 """
 
-from app.core.scraper import scrape_article
-from app.core.embedder import get_best_matching_sentences
-from app.core.stance_detector import detect_stance
+from app.core.scraper import scrape_article_async, get_async_client
+from app.core.embedder import get_best_matching_sentences_batch, encode_claim
+from app.core.stance_detector import batch_detect_stance, prewarm_claim
 from app.core.source_scorer import get_source_weight, is_social_media
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,21 +34,28 @@ SIMILARITY_THRESHOLD = 0.25  # Lowered slightly for more coverage
 # Number of top sentences to analyze per source (accuracy improvement)
 TOP_SENTENCES_PER_SOURCE = 3
 
+# Score slot per stance label; anything else counts as "discusses"
+_STANCE_LABELS = ("supports", "refutes", "discusses")
+_STANCE_INDEX = {"supports": 0, "refutes": 1}
+
 
 def split_into_sentences(text: str) -> list:
     """
     Split text into sentences using spacy or fallback to simple splitting.
     
+    Uses the rule-based sentencizer pipeline; no tagging, parsing or NER
+    is needed just to find sentence boundaries.
+    
     Args:
         text: Article text to split
         
     Returns:
         List of sentences with length > 20 chars
     """
-    from app.core.model_registry import get_spacy_nlp
+    from app.core.model_registry import get_spacy_senter
     
     try:
-        nlp = get_spacy_nlp()
+        nlp = get_spacy_senter()
         # Reduced from 50000 to 10000 chars
         doc = nlp(text[:10000])
         sentences = [sent.text.strip() for sent in doc.sents if len(sent.text.strip()) > 20]
@@ -49,34 +66,69 @@ def split_into_sentences(text: str) -> list:
         return sentences[:50]
 
 
-def process_single_result(item: dict, claim: str) -> dict:
+async def fetch_source_sentences(client, executor, item: dict):
     """
-    Process a single search result to extract evidence.
-    Uses multi-sentence evidence for higher accuracy.
+    Fetch a single search result and split it into candidate sentences.
+    The fetch is awaited; extraction and splitting run in the executor.
     
     Args:
+        client: Shared httpx.AsyncClient for article fetches
+        executor: Thread pool for CPU-bound work
         item: Search result dict with 'href', 'title', 'body'
-        claim: The claim being fact-checked
         
     Returns:
-        Evidence dict or None if processing fails
+        (url, sentences) tuple or None if processing fails
     """
     try:
         url = item.get("href")
         if not url:
             return None
             
-        article_text = scrape_article(url)
+        article_text = await scrape_article_async(client, url, executor)
         if not article_text:
             return None
-            
-        sentences = split_into_sentences(article_text)
+        
+        loop = asyncio.get_running_loop()
+        sentences = await loop.run_in_executor(executor, split_into_sentences, article_text)
         if not sentences:
             return None
+        return url, sentences
+    except Exception as e:
+        logger.warning(f"Error processing {item.get('href', 'unknown')}: {e}")
+        return None
+
+
+def select_stance_candidates(top_sentences: list) -> list:
+    """
+    Pick the sentences of a source that are worth running stance detection on.
+    
+    Args:
+        top_sentences: (sentence, similarity) tuples, best first
         
-        # Get top N matching sentences (accuracy improvement)
-        top_sentences = get_best_matching_sentences(claim, sentences, top_n=TOP_SENTENCES_PER_SOURCE)
+    Returns:
+        (sentence, similarity) tuples at or above SIMILARITY_THRESHOLD;
+        empty if the best sentence falls below it (early exit)
+    """
+    if not top_sentences or top_sentences[0][1] < SIMILARITY_THRESHOLD:
+        return []
+    return [(sent, sim) for sent, sim in top_sentences if sim >= SIMILARITY_THRESHOLD]
+
+
+def build_source_evidence(url: str, top_sentences: list, stance_results: list) -> dict:
+    """
+    Turn a source's top matching sentences into an evidence dict.
+    Uses multi-sentence evidence for higher accuracy.
+    
+    Args:
+        url: Source URL of the article
+        top_sentences: (sentence, similarity) tuples, best first
+        stance_results: Stance dicts for the source's candidate sentences
+            (see select_stance_candidates), best first
         
+    Returns:
+        Evidence dict or None if no usable evidence was found
+    """
+    try:
         if not top_sentences:
             return None
         
@@ -97,18 +149,6 @@ def process_single_result(item: dict, claim: str) -> dict:
                 "supporting_sentences": [],
             }
         
-        # Perform stance detection on all top sentences for accuracy
-        stance_results = []
-        for sent, sim in top_sentences:
-            if sim >= SIMILARITY_THRESHOLD:
-                stance = detect_stance(sent, claim)
-                stance_results.append({
-                    "sentence": sent,
-                    "similarity": sim,
-                    "stance": stance["label"],
-                    "confidence": stance["confidence"]
-                })
-        
         # Aggregate stance from multiple sentences
         aggregated_stance = aggregate_sentence_stances(stance_results)
         
@@ -125,7 +165,7 @@ def process_single_result(item: dict, claim: str) -> dict:
             "supporting_sentences": stance_results[1:] if len(stance_results) > 1 else [],
         }
     except Exception as e:
-        logger.warning(f"Error processing {item.get('href', 'unknown')}: {e}")
+        logger.warning(f"Error analyzing {url}: {e}")
         return None
 
 
@@ -146,54 +186,89 @@ def aggregate_sentence_stances(stance_results: list) -> dict:
     if len(stance_results) == 1:
         return {"label": stance_results[0]["stance"], "confidence": stance_results[0]["confidence"]}
     
-    # Weight by similarity × confidence
-    support_score = 0.0
-    refute_score = 0.0
-    neutral_score = 0.0
-    
+    # Weight by similarity × confidence, accumulated per stance in one pass
+    scores = [0.0, 0.0, 0.0]
     for result in stance_results:
-        weight = result["similarity"] * result["confidence"]
-        if result["stance"] == "supports":
-            support_score += weight
-        elif result["stance"] == "refutes":
-            refute_score += weight
-        else:
-            neutral_score += weight
-    
-    total = support_score + refute_score + neutral_score
+        scores[_STANCE_INDEX.get(result["stance"], 2)] += result["similarity"] * result["confidence"]
+    
+    total = scores[0] + scores[1] + scores[2]
     if total == 0:
         return {"label": "discusses", "confidence": 0.0}
     
-    # Determine winning stance
-    if support_score >= refute_score and support_score >= neutral_score:
-        label = "supports"
-        confidence = support_score / total
-    elif refute_score >= support_score and refute_score >= neutral_score:
-        label = "refutes"
-        confidence = refute_score / total
-    else:
-        label = "discusses"
-        confidence = neutral_score / total
+    # Determine winning stance (ties favor supports, then refutes)
+    best = max(range(3), key=scores.__getitem__)
     
-    return {"label": label, "confidence": confidence}
+    return {"label": _STANCE_LABELS[best], "confidence": scores[best] / total}
 
 
-def build_evidence(claim: str, search_results: list, max_workers: int = 3):
+def prepare_claim(claim: str) -> None:
     """
-    Build evidence from search results with parallel processing.
-    Reduced max_workers from 5 to 3 to limit thread memory overhead.
+    Do the claim-only work of build_evidence ahead of time.
+    
+    Loads the SBERT and NLI models if needed, caches the claim embedding
+    and tokenizes the NLI hypotheses. Run it concurrently with web_search;
+    build_evidence then picks the results up from the caches.
+    """
+    encode_claim(claim)
+    prewarm_claim(claim)
+
+
+def build_evidence(claim: str, search_results: list, max_workers: int = 3):
     """
-    evidences = []
+    Build evidence from search results in three phases.
+    
+    1. All article fetches run concurrently on one event loop (no thread
+       per URL) and each article is split into candidate sentences.
+    2. Every sentence from every source is embedded in one SBERT encode.
+    3. Each source's top sentences above the similarity threshold are
+       gathered and classified in one batched NLI call, then scattered
+       back to their sources for aggregation.
     
+    max_workers bounds only the threads doing CPU-bound work, kept at 3
+    to limit memory overhead.
+    """
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(process_single_result, item, claim): item 
-            for item in search_results
-        }
-        
-        for future in as_completed(futures):
-            result = future.result()
-            if result:
-                evidences.append(result)
+        sources = asyncio.run(_fetch_all_sources(search_results, executor))
+    if not sources:
+        return []
+    
+    top_per_source = get_best_matching_sentences_batch(
+        claim,
+        [sentences for _, sentences in sources],
+        top_n=TOP_SENTENCES_PER_SOURCE
+    )
+    
+    # One NLI forward pass over the candidates of all sources
+    candidates_per_source = [select_stance_candidates(top) for top in top_per_source]
+    stances = batch_detect_stance(
+        [sent for candidates in candidates_per_source for sent, _ in candidates],
+        claim
+    )
     
-    return evidences
+    results = []
+    offset = 0
+    for (url, _), top_sentences, candidates in zip(sources, top_per_source, candidates_per_source):
+        stance_results = [
+            {
+                "sentence": sent,
+                "similarity": sim,
+                "stance": stance["label"],
+                "confidence": stance["confidence"]
+            }
+            for (sent, sim), stance in zip(candidates, stances[offset:offset + len(candidates)])
+        ]
+        offset += len(candidates)
+        
+        evidence = build_source_evidence(url, top_sentences, stance_results)
+        if evidence:
+            results.append(evidence)
+    return results
+
+
+async def _fetch_all_sources(search_results: list, executor) -> list:
+    async with get_async_client() as client:
+        sources = await asyncio.gather(*[
+            fetch_source_sentences(client, executor, item)
+            for item in search_results
+        ])
+    return [source for source in sources if source]
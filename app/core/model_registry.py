@@ -6,8 +6,20 @@ This prevents memory exhaustion during Gunicorn worker spawn.
 
 Optimizations applied:
 - Torch gradients disabled globally (Rank 2)
+- Torch intra-op threads pinned to the core count, MKL-DNN enabled
 - Tokenizer parallelism disabled (Rank 9)
 - Models set to eval mode after loading
+- INT8 ONNX Runtime Sentence-BERT when exported
+- PyTorch Sentence-BERT fallback cast to BF16 on AVX512-BF16 CPUs (INT8 opt-in)
+- KeyBERT reuses the Sentence-BERT singleton (one MiniLM copy in memory)
+- NLI model in BF16 on CPUs with native BF16 support
+- INT8 ONNX Runtime DeBERTa NLI when exported (STANCE_MODEL=deberta)
+- Optional shared-memory weights for multi-worker Gunicorn (SHARE_MODEL_MEMORY)
+- spaCy loaded with only the components we use (NER + sentencizer)
+- Rule-based sentencizer-only pipeline for plain sentence splitting
+
+Under Gunicorn, call warmup_all_models() in the master before workers fork
+(see gunicorn_conf.py) rather than per worker.
 """
 
 import os
@@ -21,11 +33,23 @@ os.environ["TOKENIZERS_PARALLELISM"] = "false"
 import torch
 torch.set_grad_enabled(False)
 
+# Use every core for intra-op parallelism (torch may default to 1 thread in
+# containers). With several Gunicorn workers on one host, set
+# TORCH_NUM_THREADS to cores / workers to avoid oversubscription.
+torch.set_num_threads(int(os.getenv("TORCH_NUM_THREADS", os.cpu_count() or 4)))
+try:
+    torch.set_num_interop_threads(int(os.getenv("TORCH_INTEROP_THREADS", "2")))
+except RuntimeError:
+    # Can only be set once, before any inter-op parallel work has started
+    pass
+torch.backends.mkldnn.enabled = True
+
 logger = logging.getLogger(__name__)
 
 # Thread-safe locks for singleton initialization
 _locks = {
     "spacy": Lock(),
+    "spacy_senter": Lock(),
     "keybert": Lock(),
     "sbert": Lock(),
     "nli": Lock(),
@@ -34,6 +58,7 @@ _locks = {
 # Singleton instances (None until first access)
 _instances = {
     "spacy": None,
+    "spacy_senter": None,
     "keybert": None,
     "sbert": None,
     "nli": None,
@@ -42,45 +67,214 @@ _instances = {
 
 
 def get_spacy_nlp():
-    """Lazy-load spaCy model (singleton)."""
+    """
+    Lazy-load spaCy model (singleton).
+
+    Only NER and sentence boundaries are used, so the dependency parser,
+    lemmatizer and attribute ruler are disabled and sentences come from
+    the rule-based sentencizer instead of the parser.
+    """
     if _instances["spacy"] is None:
         with _locks["spacy"]:
             if _instances["spacy"] is None:
                 import spacy
                 logger.info("Loading spaCy model (en_core_web_sm)...")
-                _instances["spacy"] = spacy.load("en_core_web_sm")
+                nlp = spacy.load(
+                    "en_core_web_sm",
+                    disable=["parser", "lemmatizer", "attribute_ruler"]
+                )
+                nlp.add_pipe("sentencizer", first=True)
+                _instances["spacy"] = nlp
                 logger.info("✓ spaCy model loaded")
     return _instances["spacy"]
 
 
+def get_spacy_senter():
+    """
+    Lazy-load a sentence-splitting-only spaCy pipeline (singleton).
+
+    A blank English pipeline with the rule-based sentencizer: no model
+    weights to load and much faster than get_spacy_nlp() on long article
+    text, where only sentence boundaries are needed.
+    """
+    if _instances["spacy_senter"] is None:
+        with _locks["spacy_senter"]:
+            if _instances["spacy_senter"] is None:
+                import spacy
+                nlp = spacy.blank("en")
+                nlp.add_pipe("sentencizer")
+                _instances["spacy_senter"] = nlp
+                logger.info("✓ spaCy sentencizer loaded")
+    return _instances["spacy_senter"]
+
+
 def get_keybert_model():
-    """Lazy-load KeyBERT model (singleton)."""
+    """
+    Lazy-load KeyBERT model (singleton).
+
+    KeyBERT embeds with the shared Sentence-BERT singleton instead of
+    loading a second copy of all-MiniLM-L6-v2.
+    """
     if _instances["keybert"] is None:
         with _locks["keybert"]:
             if _instances["keybert"] is None:
                 from keybert import KeyBERT
                 logger.info("Loading KeyBERT model...")
-                _instances["keybert"] = KeyBERT(model="all-MiniLM-L6-v2")
-                logger.info("✓ KeyBERT model loaded")
+                _instances["keybert"] = KeyBERT(model=_as_keybert_backend(get_sbert_model()))
+                logger.info("✓ KeyBERT model loaded (shared Sentence-BERT)")
     return _instances["keybert"]
 
 
+def _as_keybert_backend(model):
+    """
+    Adapt the Sentence-BERT singleton for KeyBERT.
+
+    KeyBERT recognizes SentenceTransformer instances itself; anything else
+    (the ONNX encoder) would make it load a multilingual default model, so
+    it is wrapped in a KeyBERT embedding backend.
+    """
+    from keybert.backend import BaseEmbedder
+    from app.core.onnx_models import OnnxSentenceEncoder
+
+    if not isinstance(model, OnnxSentenceEncoder):
+        return model
+
+    class OnnxKeyBERTBackend(BaseEmbedder):
+        def embed(self, documents, verbose=False):
+            return self.embedding_model.encode(documents)
+
+    return OnnxKeyBERTBackend(model)
+
+
 def get_sbert_model():
-    """Lazy-load Sentence-BERT model (singleton)."""
+    """
+    Lazy-load Sentence-BERT model (singleton).
+
+    Prefers the INT8-quantized ONNX Runtime export when it exists
+    (see app/core/onnx_models.py), falling back to the PyTorch model.
+    """
     if _instances["sbert"] is None:
         with _locks["sbert"]:
             if _instances["sbert"] is None:
-                from sentence_transformers import SentenceTransformer
-                logger.info("Loading Sentence-BERT model (all-MiniLM-L6-v2)...")
-                model = SentenceTransformer("all-MiniLM-L6-v2")
-                model.eval()  # Optimization #2: Set to eval mode
+                from app.core.onnx_models import SBERT_ONNX_DIR, OnnxSentenceEncoder, is_exported
+
+                model = None
+                if is_exported(SBERT_ONNX_DIR):
+                    try:
+                        logger.info(f"Loading Sentence-BERT INT8 ONNX model ({SBERT_ONNX_DIR})...")
+                        model = OnnxSentenceEncoder(SBERT_ONNX_DIR)
+                        logger.info("✓ Sentence-BERT model loaded (onnx-int8)")
+                    except Exception as e:
+                        logger.warning(f"ONNX Sentence-BERT failed, using PyTorch: {e}")
+
+                if model is None:
+                    from sentence_transformers import SentenceTransformer
+                    logger.info("Loading Sentence-BERT model (all-MiniLM-L6-v2)...")
+                    model = SentenceTransformer("all-MiniLM-L6-v2")
+                    model.eval()  # Optimization #2: Set to eval mode
+                    model, precision = _reduce_sbert_precision(model)
+                    _share_memory(model)
+                    logger.info(f"✓ Sentence-BERT model loaded ({precision})")
                 _instances["sbert"] = model
-                logger.info("✓ Sentence-BERT model loaded")
     return _instances["sbert"]
 
 
+def _share_memory(module) -> None:
+    """
+    Move a torch module's weights into shared memory when SHARE_MODEL_MEMORY=true.
+
+    Models loaded before fork are already shared copy-on-write; shared
+    memory additionally keeps the pages shared if anything writes to them.
+    The weights live in /dev/shm, so the container needs a large enough
+    shm size (Docker defaults to 64MB).
+    """
+    if os.getenv("SHARE_MODEL_MEMORY", "false").lower() != "true":
+        return
+    if isinstance(module, torch.nn.Module):
+        module.share_memory()
+
+
+def _cpu_supports_bf16() -> bool:
+    """Check for native AVX512-BF16 support (Cooper Lake / Sapphire Rapids+)."""
+    # Private helper, renamed across torch releases
+    check = (
+        getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+        or getattr(torch.cpu, "_is_cpu_support_avx512_bf16", None)
+    )
+    try:
+        return bool(check and check())
+    except Exception:
+        return False
+
+
+def _reduce_sbert_precision(model):
+    """
+    Lower the precision of the PyTorch Sentence-BERT model for CPU inference.
+
+    SBERT_PRECISION selects the mode: "auto" (default) casts to bfloat16 on
+    CPUs with native BF16 support and keeps float32 otherwise; "bf16",
+    "int8" and "fp32" force one. INT8 (dynamic quantization of the Linear
+    layers) is faster on CPUs without BF16 but shifts similarity scores
+    slightly, which can change which evidence sentences are selected, so
+    it is never chosen automatically.
+
+    Returns:
+        (model, precision) tuple
+    """
+    precision = os.getenv("SBERT_PRECISION", "auto").lower()
+    if precision == "auto":
+        precision = "bf16" if _cpu_supports_bf16() else "fp32"
+
+    if precision == "bf16":
+        return model.to(torch.bfloat16), precision
+    if precision == "int8":
+        quantized = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        return quantized, precision
+    return model, "fp32"
+
+
+def _nli_dtype():
+    """
+    Weight dtype for the NLI model.
+
+    NLI_PRECISION selects it: "auto" (default) uses bfloat16 on CPUs with
+    native BF16 support (AVX512-BF16 / AMX) and float32 otherwise, where
+    emulated BF16 matmuls would be slower; "bf16" and "fp32" force one.
+    """
+    precision = os.getenv("NLI_PRECISION", "auto").lower()
+    if precision == "bf16" or (precision == "auto" and _cpu_supports_bf16()):
+        return torch.bfloat16
+    return torch.float32
+
+
+def _load_onnx_nli():
+    """
+    Load the INT8 ONNX Runtime DeBERTa NLI export if it exists
+    (see app/core/onnx_models.py), else return None.
+    """
+    from app.core.onnx_models import NLI_ONNX_DIR, OnnxNLIClassifier, is_exported
+
+    if not is_exported(NLI_ONNX_DIR):
+        return None
+    try:
+        logger.info(f"Loading NLI classifier INT8 ONNX model ({NLI_ONNX_DIR})...")
+        classifier = OnnxNLIClassifier(NLI_ONNX_DIR)
+        logger.info("✓ NLI classifier loaded (deberta, onnx-int8)")
+        return classifier
+    except Exception as e:
+        logger.warning(f"ONNX NLI classifier failed, using PyTorch: {e}")
+        return None
+
+
 def get_nli_classifier():
-    """Lazy-load NLI classifier (singleton). Returns (classifier, model_key)."""
+    """
+    Lazy-load NLI classifier (singleton). Returns (classifier, model_key).
+
+    With STANCE_MODEL=deberta the INT8 ONNX Runtime export is preferred
+    when present; otherwise a transformers zero-shot pipeline is loaded.
+    """
     if _instances["nli"] is None:
         with _locks["nli"]:
             if _instances["nli"] is None:
@@ -98,15 +292,25 @@ def get_nli_classifier():
                     model_key = "deberta"
                 
                 model_name = MODELS[model_key]
-                logger.info(f"Loading NLI classifier ({model_key}: {model_name})...")
+                
+                if model_key == "deberta":
+                    _instances["nli"] = _load_onnx_nli()
+                    if _instances["nli"] is not None:
+                        _instances["nli_model_key"] = model_key
+                        return _instances["nli"], _instances["nli_model_key"]
+                
+                dtype = _nli_dtype()
+                logger.info(f"Loading NLI classifier ({model_key}: {model_name}, {dtype})...")
                 
                 try:
                     _instances["nli"] = pipeline(
                         "zero-shot-classification",
                         model=model_name,
-                        device=-1
+                        device=-1,
+                        torch_dtype=dtype
                     )
                     _instances["nli_model_key"] = model_key
+                    _share_memory(_instances["nli"].model)
                     logger.info(f"✓ NLI classifier loaded ({model_key})")
                 except Exception as e:
                     if model_key == "deberta":
@@ -115,9 +319,11 @@ def get_nli_classifier():
                     _instances["nli"] = pipeline(
                         "zero-shot-classification",
                         model=MODELS["deberta"],
-                        device=-1
+                        device=-1,
+                        torch_dtype=dtype
                     )
                     _instances["nli_model_key"] = "deberta"
+                    _share_memory(_instances["nli"].model)
                     logger.info("✓ NLI classifier loaded (deberta fallback)")
     
     return _instances["nli"], _instances["nli_model_key"]
@@ -133,13 +339,20 @@ def are_models_loaded() -> bool:
 
 
 def warmup_all_models():
-    """Load all models for warmup endpoint."""
+    """
+    Load all models for warmup endpoint.
+
+    Also called by gunicorn_conf.py in the master process before workers
+    fork, so the loaded weights are shared copy-on-write by all workers.
+    """
     get_spacy_nlp()
+    get_spacy_senter()
     get_sbert_model()
     get_keybert_model()
     get_nli_classifier()
     return {
         "spacy": _instances["spacy"] is not None,
+        "spacy_senter": _instances["spacy_senter"] is not None,
         "sbert": _instances["sbert"] is not None,
         "keybert": _instances["keybert"] is not None,
         "nli": _instances["nli"] is not None
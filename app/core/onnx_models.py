@@ -0,0 +1,248 @@
+"""
+ONNX Runtime Model Wrappers - INT8 Quantized CPU Inference
+
+Serves dynamically quantized (INT8) ONNX exports of the transformer models
+through ONNX Runtime instead of PyTorch. Int8 GEMM kernels (AVX512-VNNI)
+give ~2-4x faster CPU inference and ~4x smaller weights with ~0.3% accuracy
+loss on BERT-style encoders.
+
+One-time export (requires `pip install optimum[onnxruntime]`):
+    python -m app.core.onnx_models sbert
+    python -m app.core.onnx_models nli
+
+The model registry picks up the exported models automatically when present
+(the NLI export with STANCE_MODEL=deberta) and falls back to the PyTorch
+models otherwise.
+"""
+
+import os
+import logging
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SBERT_HF_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+SBERT_ONNX_DIR = os.getenv("SBERT_ONNX_DIR", os.path.join(ROOT_DIR, "models", "sbert-int8"))
+EMBEDDING_DIM = 384
+
+NLI_HF_NAME = "MoritzLaurer/deberta-v3-base-zeroshot-v2.0"
+NLI_ONNX_DIR = os.getenv("NLI_ONNX_DIR", os.path.join(ROOT_DIR, "models", "deberta-int8"))
+
+# File name written by ORTQuantizer.quantize() (default "quantized" suffix)
+QUANTIZED_FILE = "model_quantized.onnx"
+
+
+def is_exported(model_dir: str) -> bool:
+    """Check whether a quantized ONNX export exists in model_dir."""
+    return os.path.isfile(os.path.join(model_dir, QUANTIZED_FILE))
+
+
+def _create_session(model_dir: str):
+    """CPU InferenceSession for the quantized model using all cores."""
+    import onnxruntime as ort
+
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = os.cpu_count() or 1
+    return ort.InferenceSession(
+        os.path.join(model_dir, QUANTIZED_FILE),
+        sess_options=sess_options,
+        providers=["CPUExecutionProvider"],
+    )
+
+
+class OnnxSentenceEncoder:
+    """
+    Drop-in replacement for SentenceTransformer.encode() backed by ONNX Runtime.
+
+    Reproduces the all-MiniLM-L6-v2 pipeline: tokenize -> transformer ->
+    mean pooling over the attention mask -> L2 normalization.
+    """
+
+    def __init__(self, model_dir: str, max_seq_length: int = 256):
+        from transformers import AutoTokenizer
+
+        self.session = _create_session(model_dir)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_seq_length = max_seq_length
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def eval(self):
+        """No-op for API parity with torch modules."""
+        return self
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        convert_to_tensor: bool = False,
+        **kwargs
+    ):
+        """
+        Encode sentences into L2-normalized embeddings.
+
+        Args:
+            sentences: A sentence or list of sentences
+            batch_size: Number of sentences per ONNX Runtime call
+            convert_to_numpy: Return a numpy array (default, like SentenceTransformer)
+            convert_to_tensor: Return a torch tensor instead
+
+        Returns:
+            Embeddings of shape (dim,) for a single sentence or (N, dim) for a list
+        """
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        # Smart batching: group similar-length sentences so each batch pads
+        # only to its own max length, then restore the caller's order.
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+        sorted_sentences = [sentences[i] for i in order]
+
+        batches = []
+        for start in range(0, len(sorted_sentences), batch_size):
+            batch = sorted_sentences[start:start + batch_size]
+            inputs = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feed = {k: v.astype(np.int64) for k, v in inputs.items() if k in self._input_names}
+            token_embs = self.session.run(None, feed)[0]
+
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embs * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            batches.append(pooled.astype(np.float32))
+
+        if batches:
+            stacked = np.concatenate(batches)
+            embeddings = np.empty_like(stacked)
+            embeddings[order] = stacked
+        else:
+            embeddings = np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+        if single:
+            embeddings = embeddings[0]
+
+        if convert_to_tensor:
+            import torch
+            return torch.from_numpy(embeddings)
+        return embeddings
+
+
+class _OnnxSequenceClassifier:
+    """Callable with the torch model's interface: model(**inputs).logits."""
+
+    def __init__(self, session):
+        import torch
+
+        self.session = session
+        self.device = torch.device("cpu")
+        self._input_names = {i.name for i in session.get_inputs()}
+
+    def __call__(self, **inputs):
+        import torch
+        from types import SimpleNamespace
+
+        feed = {
+            k: v.cpu().numpy().astype(np.int64)
+            for k, v in inputs.items() if k in self._input_names
+        }
+        logits = self.session.run(None, feed)[0]
+        return SimpleNamespace(logits=torch.from_numpy(logits))
+
+
+class OnnxNLIClassifier:
+    """
+    INT8 ONNX Runtime replacement for the zero-shot NLI pipeline.
+
+    Exposes what the stance detector uses from the transformers pipeline:
+    `tokenizer`, `model` (called as model(**inputs).logits) and
+    `entailment_id`.
+    """
+
+    def __init__(self, model_dir: str):
+        from transformers import AutoConfig, AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = _OnnxSequenceClassifier(_create_session(model_dir))
+        config = AutoConfig.from_pretrained(model_dir)
+        self.entailment_id = next(
+            (idx for label, idx in config.label2id.items() if label.lower().startswith("entail")),
+            -1,
+        )
+
+
+def _export_int8(model_cls, hf_name: str, save_dir: str) -> str:
+    """Export a Hugging Face model to ONNX and apply INT8 dynamic quantization."""
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    logger.info(f"Exporting {hf_name} to ONNX...")
+    model = model_cls.from_pretrained(hf_name, export=True)
+    tokenizer = AutoTokenizer.from_pretrained(hf_name)
+
+    logger.info("Applying INT8 dynamic quantization (avx512_vnni)...")
+    quantizer = ORTQuantizer.from_pretrained(model)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+    tokenizer.save_pretrained(save_dir)
+    model.config.save_pretrained(save_dir)
+
+    logger.info(f"✓ Quantized model saved to {save_dir}")
+    return save_dir
+
+
+def export_sbert_int8(save_dir: str = SBERT_ONNX_DIR) -> str:
+    """
+    Export all-MiniLM-L6-v2 to ONNX and apply INT8 dynamic quantization.
+
+    Args:
+        save_dir: Directory to write the quantized model and tokenizer to
+
+    Returns:
+        Path of the directory containing the quantized model
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+
+    return _export_int8(ORTModelForFeatureExtraction, SBERT_HF_NAME, save_dir)
+
+
+def export_nli_int8(save_dir: str = NLI_ONNX_DIR) -> str:
+    """
+    Export the DeBERTa-v3 zero-shot NLI model to ONNX and apply INT8
+    dynamic quantization.
+
+    Args:
+        save_dir: Directory to write the quantized model, tokenizer and config to
+
+    Returns:
+        Path of the directory containing the quantized model
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    return _export_int8(ORTModelForSequenceClassification, NLI_HF_NAME, save_dir)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="Export INT8-quantized ONNX models")
+    parser.add_argument("model", choices=["sbert", "nli"], help="Model to export")
+    parser.add_argument("--save-dir", default=None, help="Output directory")
+    args = parser.parse_args()
+
+    if args.model == "sbert":
+        export_sbert_int8(args.save_dir or SBERT_ONNX_DIR)
+    elif args.model == "nli":
+        export_nli_int8(args.save_dir or NLI_ONNX_DIR)
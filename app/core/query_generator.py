@@ -3,6 +3,8 @@ Query Generator Module
 
 Generates multiple search queries from a claim using NER (Named Entity Recognition).
 Creates diverse queries to maximize evidence coverage.
+Near-duplicate entity/keyword queries are pruned by SBERT similarity so
+each search (and its scraping downstream) adds new coverage.
 Model is lazy-loaded via model_registry to prevent import-time memory allocation.
 """
 
@@ -11,8 +13,18 @@ from typing import List
 
 logger = logging.getLogger(__name__)
 
+# Cosine similarity at or above which two queries count as duplicates
+QUERY_DEDUP_THRESHOLD = 0.9
 
-def generate_queries(claim: str, keywords: list[str] | None = None) -> List[str]:
+# Maximum number of queries sent to web search
+MAX_QUERIES = 10
+
+
+def generate_queries(
+    claim: str,
+    keywords: list[str] | None = None,
+    entities: list[str] | None = None
+) -> List[str]:
     """
     Generate multiple search queries from a claim.
     
@@ -23,15 +35,18 @@ def generate_queries(claim: str, keywords: list[str] | None = None) -> List[str]
     Args:
         claim: The claim to generate queries for
         keywords: Optional list of keywords extracted by KeyBERT
+        entities: Optional pre-computed named entities of the claim; when
+            given, the spaCy NER pass over the claim is skipped
         
     Returns:
         List of unique search query strings
     """
-    from app.core.model_registry import get_spacy_nlp
-    
-    nlp = get_spacy_nlp()
-    doc = nlp(claim)
-    entities = [ent.text for ent in doc.ents]
+    if entities is None:
+        from app.core.model_registry import get_spacy_nlp
+        
+        nlp = get_spacy_nlp()
+        doc = nlp(claim)
+        entities = [ent.text for ent in doc.ents]
     
     logger.debug(f"Extracted entities: {entities}")
     if keywords:
@@ -39,13 +54,16 @@ def generate_queries(claim: str, keywords: list[str] | None = None) -> List[str]
 
     base = claim.lower()
 
-    queries = [
+    # Base templates phrase the claim for different kinds of results
+    # (debunks, fact checks) and are always kept
+    templates = [
         base,
         base + " fact check",
         base + " true or false",
         base + " hoax",
         base + " authenticity check",
     ]
+    queries = list(templates)
 
     # Entity-based queries for better coverage
     for e in entities:
@@ -61,9 +79,21 @@ def generate_queries(claim: str, keywords: list[str] | None = None) -> List[str]
             queries.append(f"{kw} {base}")
             queries.append(f"{kw} news")
 
-    unique_queries = list(set(queries))
+    # Exact duplicates first (order preserving), then near-duplicates
+    unique_queries = list(dict.fromkeys(queries))
+    try:
+        from app.core.embedder import prune_near_duplicates
+        
+        unique_queries = prune_near_duplicates(
+            unique_queries,
+            threshold=QUERY_DEDUP_THRESHOLD,
+            protected=len(templates)
+        )
+    except Exception as e:
+        logger.warning(f"Query deduplication skipped: {e}")
+    
     # Limit to 10 queries max for performance
-    unique_queries = unique_queries[:10]
+    unique_queries = unique_queries[:MAX_QUERIES]
     logger.info(f"Generated {len(unique_queries)} queries from claim")
     
     return unique_queries
@@ -6,78 +6,283 @@ Handles errors gracefully and implements timeout protection.
 
 Optimizations applied:
 - Reduced timeout from 15s to 8s (Rank 8)
-- Connection pooling via requests.Session (Rank 10)
+- Async HTTP/2 fetching with connection pooling via httpx (Rank 10)
+- Sync path reuses one pooled HTTP/2 client (persistent TCP/TLS per host)
+- gzip/brotli compressed responses
+- LRU cache of extracted text keyed by canonical URL
+- Fast extraction: no fallback extractors, no comments/tables/formatting
+- Page bodies streamed in chunks and capped at MAX_HTML_BYTES (sync and async)
 """
 
-from trafilatura import fetch_url, extract
+from trafilatura import extract
 from trafilatura.settings import use_config
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from cachetools import LRUCache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from threading import Lock
+import asyncio
+import httpx
 import logging
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Optimization #8: Reduced timeout from 15s to 8s
+DOWNLOAD_TIMEOUT = 8
+
 # Configure trafilatura settings
 config = use_config()
-# Optimization #8: Reduced timeout from 15s to 8s
-config.set("DEFAULT", "DOWNLOAD_TIMEOUT", "8")
-
-# Optimization #10: Connection pooling singleton
-_session = None
-
-
-def get_session() -> requests.Session:
-    """Get or create a requests session with connection pooling."""
-    global _session
-    if _session is None:
-        _session = requests.Session()
-        retry_strategy = Retry(
-            total=2,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=10,
-            max_retries=retry_strategy
-        )
-        _session.mount('http://', adapter)
-        _session.mount('https://', adapter)
-        _session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; VeriFact/2.0; +https://verifact.ai)'
-        })
-    return _session
+config.set("DEFAULT", "DOWNLOAD_TIMEOUT", str(DOWNLOAD_TIMEOUT))
+
+# Larger pages are truncated; the article body comes early in the HTML and
+# the cap bounds memory for huge or endless responses
+MAX_HTML_BYTES = 2_000_000
+
+USER_AGENT = 'Mozilla/5.0 (compatible; VeriFact/2.0; +https://verifact.ai)'
+
+# Query parameters that only track referrals and never change page content
+TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+# Compressed transfers; brotli decoding needs the brotli package (httpx[brotli])
+CLIENT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept-Encoding': 'gzip, br',
+}
+
+# Extracted article text keyed by canonical URL (shared by sync and async paths)
+_article_cache = LRUCache(maxsize=256)
+_article_cache_lock = Lock()
+
+# Shared sync client (singleton, thread-safe)
+_client = None
+_client_lock = Lock()
+
+
+def _client_options() -> dict:
+    """Connection settings shared by the sync and async clients."""
+    return {
+        "http2": True,
+        "limits": httpx.Limits(max_connections=20),
+        "timeout": DOWNLOAD_TIMEOUT,
+        "follow_redirects": True,
+        "headers": CLIENT_HEADERS,
+    }
+
+
+def get_client() -> httpx.Client:
+    """
+    Get the shared HTTP/2 client for synchronous fetches.
+
+    Reusing one pooled client keeps TCP/TLS connections alive across
+    fetches, which matters because the same few news domains come back
+    for most claims.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**_client_options())
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 client with connection pooling for concurrent fetches.
+
+    Async clients are bound to the event loop they are used on, so callers
+    create one per event loop (use as `async with get_async_client() as client`).
+    """
+    return httpx.AsyncClient(**_client_options())
+
+
+class _CappedBody:
+    """Accumulates streamed response chunks up to max_bytes."""
+    
+    def __init__(self, url: str, max_bytes: int):
+        self.url = url
+        self.max_bytes = max_bytes
+        self.chunks = []
+        self.size = 0
+    
+    def add(self, chunk: bytes) -> bool:
+        """Append a chunk; returns True once the cap is reached."""
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        if self.size >= self.max_bytes:
+            logger.debug(f"Truncated {self.url} at {self.max_bytes} bytes")
+            return True
+        return False
+    
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)[:self.max_bytes]
+
+
+def fetch_html(url: str, max_bytes: int = MAX_HTML_BYTES) -> bytes:
+    """
+    Download a page over the shared client, reading at most max_bytes.
+
+    The body is streamed in 64KB chunks (decompressed from gzip/brotli on
+    the fly) and the connection is closed once the cap is reached, so a
+    large page is never fully downloaded or held in memory.
+
+    Args:
+        url: The URL to fetch
+        max_bytes: Maximum number of (decoded) bytes to read
+
+    Returns:
+        The page body, truncated to max_bytes
+
+    Raises:
+        httpx.HTTPError: On network errors or non-2xx responses
+    """
+    body = _CappedBody(url, max_bytes)
+    with get_client().stream("GET", url) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes(chunk_size=65536):
+            if body.add(chunk):
+                break
+    return body.getvalue()
+
+
+async def fetch_html_async(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int = MAX_HTML_BYTES
+) -> bytes:
+    """Async variant of fetch_html over the given client (same streaming cap)."""
+    body = _CappedBody(url, max_bytes)
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(chunk_size=65536):
+            if body.add(chunk):
+                break
+    return body.getvalue()
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL for cache lookups.
+
+    Lowercases the host and drops the fragment and tracking parameters
+    (utm_*, fbclid, gclid) so the same article reached through different
+    referral links shares one cache entry.
+    """
+    parts = urlsplit(url)
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def clear_article_cache() -> None:
+    """Drop all cached article text."""
+    with _article_cache_lock:
+        _article_cache.clear()
+
+
+def _get_cached_article(key: str) -> Optional[str]:
+    with _article_cache_lock:
+        return _article_cache.get(key)
+
+
+def _cache_article(key: str, text: str) -> None:
+    with _article_cache_lock:
+        _article_cache[key] = text
+
+
+def _extract_text(html, url: str) -> str:
+    """
+    Run trafilatura extraction on fetched HTML (CPU-bound).
+
+    Only plain article text is needed for sentence splitting, so the
+    readability/justext fallback chain, comments, tables and formatting
+    are all skipped.
+    """
+    text = extract(
+        html,
+        no_fallback=True,
+        favor_precision=False,
+        include_comments=False,
+        include_tables=False,
+        include_formatting=False,
+        config=config
+    )
+    if text:
+        logger.debug(f"Extracted {len(text)} chars from {url}")
+    return text or ""
 
 
 def scrape_article(url: str) -> str:
     """
     Extract cleaned article text from URL.
-    
+
     Uses trafilatura to intelligently extract main article content,
     removing ads, navigation, sidebars, and other boilerplate.
-    
+    Results are cached by canonical URL, since the same article often
+    comes back for several near-duplicate search queries.
+
     Args:
         url: The URL of the article to scrape
-        
+
     Returns:
         Cleaned article text, or empty string if extraction fails
-        
+
     Example:
         >>> text = scrape_article("https://reuters.com/article/...")
         >>> print(len(text))
         2500
     """
+    key = canonicalize_url(url)
+    cached = _get_cached_article(key)
+    if cached is not None:
+        return cached
+
+    try:
+        html = fetch_html(url)
+        if not html:
+            # Failed fetches (and empty extractions) are not cached so the
+            # URL is retried next time
+            logger.debug(f"No HTML content from {url}")
+            return ""
+        text = _extract_text(html, url)
+        if text:
+            _cache_article(key, text)
+        return text
+    except Exception as e:
+        logger.warning(f"Error scraping {url}: {e}")
+        return ""
+
+
+async def scrape_article_async(client: httpx.AsyncClient, url: str, executor=None) -> str:
+    """
+    Async variant of scrape_article for fanning out over many URLs.
+
+    The network fetch is awaited on the event loop; trafilatura extraction
+    is CPU-bound and runs in the given executor (default executor if None).
+
+    Args:
+        client: Shared client from get_async_client()
+        url: The URL of the article to scrape
+        executor: Optional concurrent.futures executor for extraction
+
+    Returns:
+        Cleaned article text, or empty string if extraction fails
+    """
+    key = canonicalize_url(url)
+    cached = _get_cached_article(key)
+    if cached is not None:
+        return cached
+
     try:
-        html = fetch_url(url, config=config)
+        html = await fetch_html_async(client, url)
         if not html:
             logger.debug(f"No HTML content from {url}")
             return ""
-        text = extract(html)
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(executor, _extract_text, html, url)
         if text:
-            logger.debug(f"Extracted {len(text)} chars from {url}")
-        return text or ""
+            _cache_article(key, text)
+        return text
     except Exception as e:
         logger.warning(f"Error scraping {url}: {e}")
         return ""
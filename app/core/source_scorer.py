@@ -6,6 +6,7 @@ Social media gets lower weight, trusted news sources get higher weight.
 """
 
 from urllib.parse import urlparse
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -62,7 +63,18 @@ UNRELIABLE_SOURCES = {
     # Add known fake news sites here
 }
 
+# Single merged lookup table (exact domain -> weight), built once at import
+ALL_SOURCES = {**TRUSTED_SOURCES, **SOCIAL_MEDIA_SOURCES, **UNRELIABLE_SOURCES}
 
+# Suffix rules for academic/government domains, checked in order
+_SUFFIX_RULES = [
+    (".edu", TRUSTED_SOURCES["edu"]),
+    (".gov.in", TRUSTED_SOURCES["gov"]),
+    (".gov", TRUSTED_SOURCES["gov"]),
+]
+
+
+@lru_cache(maxsize=1024)
 def extract_domain(url: str) -> str:
     """Extract the main domain from a URL."""
     try:
@@ -93,23 +105,15 @@ def get_source_weight(url: str) -> float:
     if not domain:
         return 1.0
     
-    # Check trusted sources first
-    if domain in TRUSTED_SOURCES:
-        return TRUSTED_SOURCES[domain]
+    # Known trusted / social media / unreliable domain: one dict hit
+    weight = ALL_SOURCES.get(domain)
+    if weight is not None:
+        return weight
     
     # Check for .edu or .gov domains
-    if domain.endswith(".edu"):
-        return TRUSTED_SOURCES.get("edu", 1.3)
-    if domain.endswith(".gov") or domain.endswith(".gov.in"):
-        return TRUSTED_SOURCES.get("gov", 1.4)
-    
-    # Check social media
-    if domain in SOCIAL_MEDIA_SOURCES:
-        return SOCIAL_MEDIA_SOURCES[domain]
-    
-    # Check unreliable sources
-    if domain in UNRELIABLE_SOURCES:
-        return UNRELIABLE_SOURCES[domain]
+    for suffix, suffix_weight in _SUFFIX_RULES:
+        if domain.endswith(suffix):
+            return suffix_weight
     
     # Default weight for unknown sources
     return 1.0
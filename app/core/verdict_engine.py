@@ -8,10 +8,17 @@ Includes explanation generation for transparency.
 Accuracy improvements:
 - Tuned decision thresholds (+0.35/-0.35 instead of ±0.4)
 - Enhanced weighting formula with similarity boost
+
+Performance:
+- Evidence scores computed in one vectorized NumPy pass
+- Explanation statistics reduced from the same arrays (no re-scan of evidence)
+- With numba installed (optional), scoring and summation run as one
+  JIT-compiled loop; otherwise the NumPy expression is used
 """
 
 import math
 import logging
+import numpy as np
 from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
@@ -20,18 +27,75 @@ logger = logging.getLogger(__name__)
 THRESHOLD_TRUE = 0.35   # Was 0.4 - lowered for better recall
 THRESHOLD_FALSE = -0.35  # Was -0.4 - raised for better recall
 
+# Stance weight: +1 for support, -1 for refute, 0 (default) for discusses / neutral
+_STANCE_W = {"supports": 1, "refutes": -1}
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _score_kernel_numpy(similarity: np.ndarray, stance_score: np.ndarray,
+                        stance_w: np.ndarray, source_weight: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Weighted score per evidence and their sum."""
+    # Accuracy improvement: Boost high-similarity evidence more
+    similarity_boost = 1.0 + (similarity - 0.5) * 0.5
+    
+    scores = similarity * stance_score * stance_w * source_weight * similarity_boost
+    return scores, float(scores.sum())
+
+
+if njit is not None:
+    # Compiled eagerly at import (signature given) and cached on disk, so no
+    # request pays the JIT cost
+    @njit("Tuple((f8[::1], f8))(f8[::1], f8[::1], i1[::1], f8[::1])", cache=True)
+    def _score_kernel(similarity, stance_score, stance_w, source_weight):
+        """Fused single-pass version of _score_kernel_numpy."""
+        n = similarity.shape[0]
+        scores = np.empty(n)
+        net = 0.0
+        for i in range(n):
+            similarity_boost = 1.0 + (similarity[i] - 0.5) * 0.5
+            score = similarity[i] * stance_score[i] * stance_w[i] * source_weight[i] * similarity_boost
+            scores[i] = score
+            net += score
+        return scores, net
+else:
+    _score_kernel = _score_kernel_numpy
+
 
 def sigmoid(x: float) -> float:
     """
     Sigmoid function to normalize scores to 0-1 range.
     
+    Numerically stable: exp() only ever sees a non-positive argument, so
+    large |x| saturates to 0 or 1 instead of overflowing.
+    
     Args:
         x: Input value
         
     Returns:
         Value between 0 and 1
     """
-    return 1 / (1 + math.exp(-x))
+    if x >= 0:
+        return 1 / (1 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1 + z)
+
+
+def sigmoid_vec(x: np.ndarray) -> np.ndarray:
+    """
+    Vectorized, numerically stable sigmoid (one exp per element).
+    
+    Args:
+        x: Input array
+        
+    Returns:
+        Array of values between 0 and 1
+    """
+    z = np.exp(-np.abs(x))
+    return np.where(x >= 0, 1 / (1 + z), z / (1 + z))
 
 
 def compute_weighted_score(evidence: Dict) -> Tuple[float, str]:
@@ -50,13 +114,7 @@ def compute_weighted_score(evidence: Dict) -> Tuple[float, str]:
     stance_score = evidence["stance_score"]
     stance = evidence["stance"]
 
-    # Stance weight: +1 for support, -1 for refute, 0 for neutral
-    if stance == "supports":
-        stance_w = +1
-    elif stance == "refutes":
-        stance_w = -1
-    else:
-        stance_w = 0  # discusses / neutral
+    stance_w = _STANCE_W.get(stance, 0)
     
     source_weight = evidence.get("source_weight", 1.0)
     
@@ -68,41 +126,97 @@ def compute_weighted_score(evidence: Dict) -> Tuple[float, str]:
     return score, stance
 
 
-def build_explanation(evidences: List[Dict], scores: List[Tuple[float, str]], 
-                      net_score: float, verdict: str) -> Dict:
+def compute_weighted_scores(evidences: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Build a structured explanation of the verdict reasoning.
+    Vectorized compute_weighted_score over all evidence.
     
     Args:
         evidences: List of evidence dictionaries
-        scores: List of (score, stance) tuples
-        net_score: Final aggregated score
-        verdict: The verdict string
         
     Returns:
-        Dict with 'steps', 'breakdown', and 'decision_reason'
+        Tuple of (scores, stance_weights, source_weights) arrays aligned with
+        evidences; stance weight is +1 support, -1 refute, 0 neutral
     """
-    # Count stances
-    support_count = sum(1 for _, s in scores if s == "supports")
-    refute_count = sum(1 for _, s in scores if s == "refutes")
-    neutral_count = sum(1 for _, s in scores if s not in ("supports", "refutes"))
+    scores, _, stance_w, source_weight = _score_evidences(evidences)
+    return scores, stance_w, source_weight
+
+
+def _score_evidences(evidences: List[Dict]) -> Tuple[np.ndarray, float, np.ndarray, np.ndarray]:
+    """compute_weighted_scores plus the net score, from one kernel call."""
+    n = len(evidences)
+    similarity = np.fromiter((e["similarity"] for e in evidences), dtype=np.float64, count=n)
+    stance_score = np.fromiter((e["stance_score"] for e in evidences), dtype=np.float64, count=n)
+    source_weight = np.fromiter(
+        (e.get("source_weight", 1.0) for e in evidences), dtype=np.float64, count=n
+    )
+    stance_w = np.fromiter(
+        (_STANCE_W.get(e["stance"], 0) for e in evidences), dtype=np.int8, count=n
+    )
     
-    # Calculate weights by stance
-    support_weight = round(sum(sc for sc, st in scores if st == "supports"), 2)
-    refute_weight = round(sum(sc for sc, st in scores if st == "refutes"), 2)
+    scores, net_score = _score_kernel(similarity, stance_score, stance_w, source_weight)
+    return scores, float(net_score), stance_w, source_weight
+
+
+def compute_evidence_stats(evidences: List[Dict], scores: np.ndarray,
+                           stance_w: np.ndarray, source_weight: np.ndarray) -> Dict:
+    """
+    Summary statistics for the explanation, from the arrays already built
+    by compute_weighted_scores (array reductions, no extra Python passes
+    except for the multi-sentence flag).
     
-    # Count trusted sources
-    trusted_count = sum(1 for e in evidences if e.get("source_weight", 1.0) > 1.0)
+    Args:
+        evidences: List of evidence dictionaries
+        scores: Weighted score per evidence
+        stance_w: Stance weight per evidence (+1 / -1 / 0)
+        source_weight: Source credibility weight per evidence
+        
+    Returns:
+        Dict of stance counts, stance weight sums, trusted and multi-sentence counts
+    """
+    support_mask = stance_w == 1
+    refute_mask = stance_w == -1
+    support_count = int(support_mask.sum())
+    refute_count = int(refute_mask.sum())
     
-    # Count multi-sentence evidence
-    multi_sent_count = sum(1 for e in evidences if e.get("supporting_sentences"))
+    return {
+        "support_count": support_count,
+        "refute_count": refute_count,
+        "neutral_count": len(evidences) - support_count - refute_count,
+        "support_weight": round(float(scores[support_mask].sum()), 2),
+        "refute_weight": round(float(scores[refute_mask].sum()), 2),
+        "trusted_count": int((source_weight > 1.0).sum()),
+        "multi_sent_count": sum(1 for e in evidences if e.get("supporting_sentences")),
+        "total_count": len(evidences),
+    }
+
+
+def build_explanation(stats: Dict, net_score: float, verdict: str) -> Dict:
+    """
+    Build a structured explanation of the verdict reasoning.
+    
+    Args:
+        stats: Evidence statistics from compute_evidence_stats
+        net_score: Final aggregated score
+        verdict: The verdict string
+        
+    Returns:
+        Dict with 'steps', 'breakdown', and 'decision_reason'
+    """
+    support_count = stats["support_count"]
+    refute_count = stats["refute_count"]
+    neutral_count = stats["neutral_count"]
+    support_weight = stats["support_weight"]
+    refute_weight = stats["refute_weight"]
+    trusted_count = stats["trusted_count"]
+    multi_sent_count = stats["multi_sent_count"]
+    total_count = stats["total_count"]
     
     # Build reasoning steps
     steps = [
         {
             "step": 1,
             "title": "Evidence Collection",
-            "detail": f"Found {len(evidences)} relevant source{'s' if len(evidences) != 1 else ''}",
+            "detail": f"Found {total_count} relevant source{'s' if total_count != 1 else ''}",
             "icon": "🔍"
         },
         {
@@ -152,7 +266,7 @@ def build_explanation(evidences: List[Dict], scores: List[Tuple[float, str]],
             "support_weight": support_weight,
             "refute_weight": refute_weight,
             "trusted_sources": trusted_count,
-            "total_sources": len(evidences),
+            "total_sources": total_count,
             "multi_sentence_evidence": multi_sent_count
         },
         "decision_reason": decision_reason,
@@ -185,13 +299,12 @@ def compute_final_verdict(evidences: List[Dict], include_explanation: bool = Tru
             "net_score": 0
         }
         if include_explanation:
-            result["explanation"] = build_explanation([], [], 0, "UNVERIFIED")
+            stats = compute_evidence_stats([], *compute_weighted_scores([]))
+            result["explanation"] = build_explanation(stats, 0, "UNVERIFIED")
         return result
 
     # Compute scores with stance info
-    score_data = [compute_weighted_score(e) for e in evidences]
-    scores = [s[0] for s in score_data]
-    net_score = sum(scores)
+    scores, net_score, stance_w, source_weight = _score_evidences(evidences)
 
     confidence = sigmoid(abs(net_score))
 
@@ -212,6 +325,7 @@ def compute_final_verdict(evidences: List[Dict], include_explanation: bool = Tru
     }
     
     if include_explanation:
-        result["explanation"] = build_explanation(evidences, score_data, net_score, verdict)
+        stats = compute_evidence_stats(evidences, scores, stance_w, source_weight)
+        result["explanation"] = build_explanation(stats, net_score, verdict)
     
     return result
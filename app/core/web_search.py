@@ -6,21 +6,103 @@ falls back to DuckDuckGo (free, no API key required) otherwise.
 
 Optimizations applied:
 - Cached Tavily/Brave API clients as singletons (Rank 7)
+- Tavily/Brave queries run concurrently, spaced by a process-wide rate limiter
+- Brave queries multiplexed over one async HTTP/2 connection (httpx)
+- TTL cache of search results keyed by the normalized query set
+- Social media check: hostname set lookup instead of substring scans
 """
 
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import List, Dict
+from urllib.parse import urlsplit
+import asyncio
 import os
 import time
 import logging
+import httpx
 
 logger = logging.getLogger(__name__)
 
 # Social media domains - included but with lower credibility weight
 SOCIAL_MEDIA_DOMAINS = ["twitter.com", "x.com", "facebook.com", "reddit.com", "instagram.com"]
+_SOCIAL_MEDIA_SET = frozenset(SOCIAL_MEDIA_DOMAINS)
+_SOCIAL_MEDIA_SUFFIXES = tuple("." + domain for domain in SOCIAL_MEDIA_DOMAINS)
 
 # Optimization #7: Cached API clients
 _tavily_client = None
-_brave_session = None
+
+BRAVE_SEARCH_URL = 'https://api.search.brave.com/res/v1/web/search'
+
+# Max concurrent requests per search
+MAX_SEARCH_WORKERS = 4
+
+# Search results keyed by (normalized queries, max_results); repeat claims
+# within the TTL skip the search API round trip entirely
+SEARCH_CACHE_TTL = 900  # seconds
+_search_cache = TTLCache(maxsize=512, ttl=SEARCH_CACHE_TTL)
+_search_cache_lock = Lock()
+
+
+class _RateLimiter:
+    """
+    Spaces out request starts across threads: at most one start per
+    `interval` seconds. Requests still overlap while waiting on the network.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = Lock()
+        self._next_start = 0.0
+    
+    def _reserve(self) -> float:
+        """Claim the next start slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        return start - now
+    
+    def wait(self):
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Shared by all requests in the process, so concurrent fact-checks also
+# stay under each API's rate limit
+_tavily_limiter = _RateLimiter(0.3)
+_brave_limiter = _RateLimiter(1.1)  # Brave free tier: 1 request/second
+
+
+def _run_queries(search_one, queries: List[str]) -> List[Dict]:
+    """
+    Run search_one(query) for all queries on a thread pool and merge the
+    results in query order, dropping duplicate URLs.
+    """
+    if not queries:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_WORKERS, len(queries))) as executor:
+        return _merge_results(executor.map(search_one, queries))
+
+
+def _merge_results(result_lists) -> List[Dict]:
+    """Concatenate per-query results in order, dropping duplicate URLs."""
+    all_results = []
+    seen_urls = set()
+    for results in result_lists:
+        for result in results:
+            if result['href'] not in seen_urls:
+                seen_urls.add(result['href'])
+                all_results.append(result)
+    return all_results
 
 
 def _get_tavily_client():
@@ -36,18 +118,24 @@ def _get_tavily_client():
     return _tavily_client
 
 
-def _get_brave_session():
-    """Get or create cached Brave session."""
-    global _brave_session
-    if _brave_session is None:
-        import requests
-        _brave_session = requests.Session()
-        _brave_session.headers.update({
+def _brave_async_client(api_key: str) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 client for the Brave API.
+    
+    All queries of one search share its connection (one TLS handshake,
+    multiplexed streams). Async clients are bound to the event loop they
+    are used on, so one is created per search (use as `async with`).
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers={
             'Accept': 'application/json',
-            'X-Subscription-Token': os.getenv('BRAVE_API_KEY', '')
-        })
-        logger.info("✓ Brave session initialized")
-    return _brave_session
+            'Accept-Encoding': 'gzip',
+            'X-Subscription-Token': api_key
+        },
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=10)
+    )
 
 
 def _tavily_search(queries: List[str], max_results: int = 6) -> List[Dict]:
@@ -55,13 +143,11 @@ def _tavily_search(queries: List[str], max_results: int = 6) -> List[Dict]:
     Search using Tavily API (faster, better quality).
     Requires TAVILY_API_KEY environment variable.
     """
-    all_results = []
-    seen_urls = set()
-    
     tavily = _get_tavily_client()
     
-    for query in queries:
+    def search_one(query: str) -> List[Dict]:
         try:
+            _tavily_limiter.wait()  # Rate limiting
             response = tavily.search(
                 query=query,
                 max_results=max_results,
@@ -69,24 +155,19 @@ def _tavily_search(queries: List[str], max_results: int = 6) -> List[Dict]:
                 include_domains=[],
                 exclude_domains=[]
             )
-            
-            for result in response.get('results', []):
-                url = result.get('url')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_results.append({
-                        'href': url,
-                        'title': result.get('title', ''),
-                        'body': result.get('content', '')
-                    })
-            
-            time.sleep(0.3)  # Rate limiting
-            
+            return [
+                {
+                    'href': result['url'],
+                    'title': result.get('title', ''),
+                    'body': result.get('content', '')
+                }
+                for result in response.get('results', []) if result.get('url')
+            ]
         except Exception as e:
             logger.warning(f"Tavily search failed for '{query}': {e}")
-            continue
+            return []
     
-    return all_results
+    return _run_queries(search_one, queries)
 
 
 def _brave_search(queries: List[str], max_results: int = 6) -> List[Dict]:
@@ -98,37 +179,37 @@ def _brave_search(queries: List[str], max_results: int = 6) -> List[Dict]:
     if not api_key:
         raise ValueError("BRAVE_API_KEY not set")
     
-    all_results = []
-    seen_urls = set()
-    
-    session = _get_brave_session()
+    return asyncio.run(_brave_search_async(queries, max_results, api_key))
+
+
+async def _brave_search_async(queries: List[str], max_results: int, api_key: str) -> List[Dict]:
+    """Gather all Brave queries on one HTTP/2 client, spaced by the rate limiter."""
     
-    for query in queries:
+    async def search_one(client: httpx.AsyncClient, query: str) -> List[Dict]:
         try:
-            response = session.get(
-                'https://api.search.brave.com/res/v1/web/search',
-                params={'q': query, 'count': max_results},
-                timeout=10
+            await _brave_limiter.wait_async()
+            response = await client.get(
+                BRAVE_SEARCH_URL,
+                params={'q': query, 'count': max_results}
             )
             response.raise_for_status()
             data = response.json()
-            
-            for result in data.get('web', {}).get('results', []):
-                url = result.get('url')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_results.append({
-                        'href': url,
-                        'title': result.get('title', ''),
-                        'body': result.get('description', '')
-                    })
-            
-            time.sleep(1.1)  # Brave free tier: 1 request/second
-            
+            return [
+                {
+                    'href': result['url'],
+                    'title': result.get('title', ''),
+                    'body': result.get('description', '')
+                }
+                for result in data.get('web', {}).get('results', []) if result.get('url')
+            ]
         except Exception as e:
             logger.warning(f"Brave search failed for '{query[:50]}...': {e}")
-            continue
+            return []
+    
+    async with _brave_async_client(api_key) as client:
+        result_lists = await asyncio.gather(*(search_one(client, q) for q in queries))
     
+    all_results = _merge_results(result_lists)
     logger.info(f"Brave total: {len(all_results)} unique results")
     return all_results
 
@@ -137,6 +218,9 @@ def _ddg_search(queries: List[str], max_results: int = 4, retries: int = 3) -> L
     """
     Search using DuckDuckGo (free, no API key required).
     Uses 'lite' backend for better reliability against rate limiting.
+    
+    Queries stay sequential with pauses: DDG has no documented rate limit
+    and blocks bursts quickly, so concurrency would trade speed for failures.
     """
     try:
         from duckduckgo_search import DDGS
@@ -217,6 +301,12 @@ def _ddg_search(queries: List[str], max_results: int = 4, retries: int = 3) -> L
     return all_results
 
 
+def clear_search_cache():
+    """Drop all cached search results."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
 def web_search(queries: List[str], max_results: int = 6) -> List[Dict]:
     """
     Perform web search with automatic API selection and fallback chain.
@@ -225,7 +315,28 @@ def web_search(queries: List[str], max_results: int = 6) -> List[Dict]:
     1. Tavily (fastest, best quality) - requires TAVILY_API_KEY
     2. Brave Search (reliable, 2000 free/month) - requires BRAVE_API_KEY
     3. DuckDuckGo (free, may hit rate limits) - no key required
+    
+    Results are cached for SEARCH_CACHE_TTL seconds, keyed by the set of
+    queries (case and surrounding whitespace ignored). Empty results are
+    not cached so failed searches are retried.
     """
+    key = (tuple(sorted(q.strip().lower() for q in queries)), max_results)
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+    if cached is not None:
+        logger.info(f"Search cache hit ({len(cached)} results)")
+        # Copies, so callers can't mutate the cached entries
+        return [dict(result) for result in cached]
+    
+    results = _search_uncached(queries, max_results)
+    if results:
+        with _search_cache_lock:
+            _search_cache[key] = [dict(result) for result in results]
+    return results
+
+
+def _search_uncached(queries: List[str], max_results: int) -> List[Dict]:
+    """Run the Tavily -> Brave -> DuckDuckGo fallback chain."""
     # Try Tavily first (fastest, best quality)
     if os.getenv('TAVILY_API_KEY'):
         try:
@@ -254,5 +365,17 @@ def web_search(queries: List[str], max_results: int = 6) -> List[Dict]:
 
 
 def is_social_media(url: str) -> bool:
-    """Check if URL is from a social media platform."""
-    return any(domain in url.lower() for domain in SOCIAL_MEDIA_DOMAINS)
+    """
+    Check if URL is from a social media platform.
+    
+    Matches the URL's hostname (or any subdomain, e.g. old.reddit.com)
+    against SOCIAL_MEDIA_DOMAINS, so paths and query strings that merely
+    mention a domain don't count.
+    """
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return False
+    if host.startswith("www."):
+        host = host[4:]
+    return host in _SOCIAL_MEDIA_SET or host.endswith(_SOCIAL_MEDIA_SUFFIXES)
@@ -3,7 +3,7 @@ Flask REST API for Fake News Detection with Optimizations
 
 Features:
 - Rate limiting (5 requests/minute per IP)
-- Input validation with Pydantic
+- Input validation with msgspec
 - Health check with metrics
 - Comprehensive error handling
 
@@ -12,18 +12,20 @@ Optimizations applied:
 - Fixed health check model status (Rank 12)
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from pydantic import BaseModel, field_validator, ValidationError
+import msgspec
 from whitenoise import WhiteNoise
-from typing import Optional
+from typing import Annotated, Optional
 import sys
 import os
 import time
 import logging
-import threading
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from datetime import datetime
 
 # Load .env file at startup (must be before other app imports)
@@ -35,26 +37,45 @@ ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from app.core.claim_extractor import extract_text_from_url, extract_claim_from_text
+from app.core.claim_extractor import extract_text_from_url, extract_claim_with_entities
 from app.core.query_generator import generate_queries
 from app.core.web_search import web_search
-from app.core.evidence_aggregator import build_evidence
+from app.core.evidence_aggregator import build_evidence, prepare_claim
 from app.core.verdict_engine import compute_final_verdict
 
+DEBUG = os.environ.get('DEBUG', 'false').lower() == 'true'
+
+# Bearer token for /api/cache/clear; the endpoint is disabled when unset
+CACHE_ADMIN_TOKEN = os.environ.get('CACHE_ADMIN_TOKEN', '')
+
 # Initialize Flask
 STATIC_DIR = os.path.join(ROOT_DIR, 'static')
 app = Flask(__name__, static_folder=STATIC_DIR, static_url_path='/static')
 CORS(app)
 
-# Wrap with WhiteNoise for production static file serving (handles Content-Length properly)
-app.wsgi_app = WhiteNoise(app.wsgi_app, root=STATIC_DIR, prefix='static/')
+# Wrap with WhiteNoise for production static file serving (handles Content-Length properly).
+# Files are indexed once at startup (no per-request stat) and the .gz/.br
+# variants built by `python -m whitenoise.compress static/` (Dockerfile) are
+# served as-is. Assets are cache-busted via ?v=N in index.html, so browsers
+# may cache them for a year; DEBUG re-scans files and disables caching.
+app.wsgi_app = WhiteNoise(
+    app.wsgi_app,
+    root=STATIC_DIR,
+    prefix='static/',
+    autorefresh=DEBUG,
+    max_age=0 if DEBUG else 31536000
+)
 
-# Rate limiting
+_index_html = None
+
+# Rate limiting: in-memory counters are per process, so with several
+# Gunicorn workers set LIMITER_REDIS_URI (e.g. redis://redis:6379/0) to
+# share them and keep the advertised limits
 limiter = Limiter(
     key_func=get_remote_address,
     app=app,
     default_limits=["100 per hour"],
-    storage_uri="memory://"
+    storage_uri=os.getenv("LIMITER_REDIS_URI", "memory://")
 )
 
 # Logging
@@ -66,7 +87,7 @@ logger = logging.getLogger(__name__)
 
 # Thread-safe Metrics
 START_TIME = datetime.now()
-_metrics_lock = threading.Lock()
+_metrics_lock = Lock()
 REQUEST_COUNT = 0
 ERROR_COUNT = 0
 
@@ -85,33 +106,41 @@ def increment_error_count():
         ERROR_COUNT += 1
 
 
+# Claim preparation (embedding + NLI inputs) overlapped with web search
+_prepare_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prepare")
+
+
 # Input validation model
-class CheckRequest(BaseModel):
-    """Pydantic model for input validation."""
+class CheckRequest(msgspec.Struct):
+    """
+    Request body of /api/check, decoded and validated from the raw JSON
+    bytes in one pass (msgspec) instead of json parse + model validation.
+    """
     text: Optional[str] = None
-    url: Optional[str] = None
+    # Empty string allowed (treated as no URL), as before
+    url: Optional[Annotated[str, msgspec.Meta(pattern=r'^(?:https?://|$)')]] = None
     claim: Optional[str] = None
-    max_results: int = 3
-    
-    @field_validator('max_results')
-    @classmethod
-    def validate_max_results(cls, v: int) -> int:
-        if v < 1 or v > 10:
-            raise ValueError('max_results must be between 1 and 10')
-        return v
-    
-    @field_validator('url')
-    @classmethod
-    def validate_url(cls, v: Optional[str]) -> Optional[str]:
-        if v and not v.startswith(('http://', 'https://')):
-            raise ValueError('URL must start with http:// or https://')
-        return v
+    max_results: Annotated[int, msgspec.Meta(ge=1, le=10)] = 3
+
+
+# strict=False accepts e.g. "3" for max_results, like the previous
+# Pydantic model did
+_check_request_decoder = msgspec.json.Decoder(CheckRequest, strict=False)
+
+
+def json_response(payload: dict) -> Response:
+    """Encode a JSON response with msgspec (faster than jsonify)."""
+    return Response(msgspec.json.encode(payload), mimetype='application/json')
 
 
 @app.route('/')
 def index():
-    """Serve the frontend."""
-    return send_from_directory('static', 'index.html')
+    """Serve the frontend (read once, re-read on every request in DEBUG)."""
+    global _index_html
+    if _index_html is None or DEBUG:
+        with open(os.path.join(STATIC_DIR, 'index.html'), 'rb') as f:
+            _index_html = f.read()
+    return Response(_index_html, mimetype='text/html')
 
 
 @app.route('/api')
@@ -124,7 +153,8 @@ def api_info():
         'endpoints': {
             '/api/health': 'Health check with metrics',
             '/api/check': 'Fact-check a claim (POST)',
-            '/api/warmup': 'Preload models (POST)'
+            '/api/warmup': 'Preload models (POST)',
+            '/api/cache/clear': 'Clear search, article and model result caches (POST, admin token)'
         }
     })
 
@@ -179,6 +209,41 @@ def warmup():
         }), 500
 
 
+@app.route('/api/cache/clear', methods=['POST'])
+@limiter.limit("5 per minute")
+def clear_caches():
+    """
+    Clear the in-process result caches (search results, scraped articles,
+    stance predictions and claim embeddings), e.g. after a breaking story
+    changes the available evidence.
+    
+    Flushing the caches forces every following request down the slow cold
+    path, so the endpoint requires `Authorization: Bearer <CACHE_ADMIN_TOKEN>`
+    and is disabled (404) when CACHE_ADMIN_TOKEN is not set.
+    """
+    if not CACHE_ADMIN_TOKEN:
+        return jsonify({'error': 'Not found'}), 404
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme != 'Bearer' or not hmac.compare_digest(token.encode(), CACHE_ADMIN_TOKEN.encode()):
+        return jsonify({'error': 'Unauthorized'}), 401
+    
+    from app.core.web_search import clear_search_cache
+    from app.core.scraper import clear_article_cache
+    from app.core.stance_detector import clear_stance_cache
+    from app.core.embedder import encode_claim
+    
+    clear_search_cache()
+    clear_article_cache()
+    clear_stance_cache()
+    encode_claim.cache_clear()
+    logger.info("Result caches cleared")
+    
+    return jsonify({
+        'status': 'cleared',
+        'caches': ['search', 'articles', 'stance', 'claim_embeddings']
+    })
+
+
 @app.route('/api/check', methods=['POST'])
 @limiter.limit("5 per minute")
 def check_claim():
@@ -200,18 +265,16 @@ def check_claim():
     start_time = time.time()
     
     try:
-        # Parse and validate input
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'Request body must be JSON'}), 400
-        
+        # Parse and validate input straight from the request bytes
         try:
-            validated = CheckRequest(**data)
-        except ValidationError as e:
+            validated = _check_request_decoder.decode(request.get_data())
+        except msgspec.ValidationError as e:
             return jsonify({
                 'error': 'Validation error',
-                'details': e.errors(include_url=False, include_context=False)
+                'details': [str(e)]
             }), 400
+        except msgspec.DecodeError:
+            return jsonify({'error': 'Request body must be JSON'}), 400
         
         # Check that at least one input is provided
         if not validated.text and not validated.url and not validated.claim:
@@ -219,8 +282,9 @@ def check_claim():
                 'error': 'Must provide at least one of: text, url, or claim'
             }), 400
         
-        # Extract claim
+        # Extract claim (entities come from the same spaCy pass when extracting)
         keywords = []
+        entities = None
         if validated.claim:
             claim = validated.claim.strip()
         elif validated.url:
@@ -228,9 +292,9 @@ def check_claim():
             full_text = extract_text_from_url(validated.url)
             if not full_text:
                 return jsonify({'error': 'Could not extract text from URL'}), 400
-            claim, keywords = extract_claim_from_text(full_text)
+            claim, keywords, entities = extract_claim_with_entities(full_text)
         else:
-            claim, keywords = extract_claim_from_text(validated.text)
+            claim, keywords, entities = extract_claim_with_entities(validated.text)
         
         if not claim or len(claim) < 10:
             return jsonify({'error': 'Could not extract a valid claim'}), 400
@@ -240,8 +304,15 @@ def check_claim():
             logger.info(f"Extracted keywords: {keywords}")
         
         # Process pipeline - include keywords for enhanced query generation
-        queries = generate_queries(claim, keywords=keywords)
+        queries = generate_queries(claim, keywords=keywords, entities=entities)
+        # CPU-side claim prep runs while the search waits on the network
+        prepared = _prepare_executor.submit(prepare_claim, claim)
         search_results = web_search(queries, max_results=validated.max_results)
+        try:
+            prepared.result()
+        except Exception as e:
+            # build_evidence redoes the work (and reports real failures)
+            logger.warning(f"Claim preparation failed: {e}")
         evidences = build_evidence(claim, search_results)
         verdict_result = compute_final_verdict(evidences)
         
@@ -249,7 +320,7 @@ def check_claim():
         logger.info(f"Completed in {processing_time}s - Verdict: {verdict_result['verdict']}")
         
         # Response
-        return jsonify({
+        return json_response({
             'claim': claim,
             'verdict': verdict_result['verdict'],
             'confidence': verdict_result['confidence'],
@@ -283,5 +354,22 @@ def ratelimit_handler(e):
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    debug = os.environ.get('DEBUG', 'false').lower() == 'true'
-    app.run(host='0.0.0.0', port=port, threaded=True, debug=debug)
+    use_dev_server = DEBUG or os.environ.get('USE_DEV_SERVER', 'false').lower() == 'true'
+    
+    if not use_dev_server:
+        # Serve with Gunicorn (gunicorn_conf.py) like production; the
+        # Werkzeug dev server handles requests in one process only
+        try:
+            import gunicorn  # noqa: F401
+        except ImportError:
+            logger.warning("gunicorn not installed, falling back to the Flask dev server")
+            use_dev_server = True
+    
+    if use_dev_server:
+        app.run(host='0.0.0.0', port=port, threaded=True, debug=DEBUG)
+    else:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        os.chdir(base_dir)
+        os.execvp(sys.executable, [
+            sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_conf.py', 'app_flask:app'
+        ])
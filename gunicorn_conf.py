@@ -0,0 +1,79 @@
+"""
+Gunicorn configuration for the VeriFact API.
+
+Usage:
+    gunicorn -c gunicorn_conf.py app_flask:app
+
+With PRELOAD_MODELS=true (opt-in), models are loaded once in the master
+process before workers fork, so every worker - including the ones
+recycled by max_requests - shares the frozen weight pages copy-on-write
+instead of loading its own ~1.5GB copy. The preloaded objects are then
+frozen (gc.freeze) so garbage collection in the workers doesn't touch
+them.
+
+Tradeoff: the master loads the models before it binds the socket, so the
+server is unreachable (and health checks fail) for the whole load. Only
+enable it where the health check's start period covers the model load;
+otherwise leave it off and models load lazily on first use (or via
+POST /api/warmup).
+"""
+
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Single worker by default to fit the 3G container limit; raise
+# WEB_CONCURRENCY on larger hosts to serve requests in parallel processes
+# (no shared GIL on the CPU-heavy NLI path)
+workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+# Threads overlap the I/O-bound search/scrape phases within each worker
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+
+# Split the cores between every request thread of every worker: each
+# concurrent NLI call runs its own torch intra-op pool, so sizing by workers
+# alone would oversubscribe the CPU up to `threads` times. A lone request
+# then uses fewer cores; set TORCH_NUM_THREADS to favour single-request
+# latency instead (read by model_registry when the app is imported)
+os.environ.setdefault("TORCH_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // (workers * threads))))
+
+# Import the app in the master so workers inherit it (and the models) on fork
+preload_app = True
+
+# Generous timeout for slow first-request model loading (if not preloaded)
+timeout = 300
+
+# Recycle workers to clear memory leaks; new workers fork from the master
+max_requests = 100
+max_requests_jitter = 10
+
+
+def on_starting(server):
+    """
+    Load all models in the master process, before any worker forks
+    (only with PRELOAD_MODELS=true).
+
+    Loading in a post_fork hook instead would give every worker a private
+    copy of the weights.
+    """
+    if os.environ.get("PRELOAD_MODELS", "false").lower() != "true":
+        return
+
+    from app.core.model_registry import warmup_all_models
+
+    server.log.info("Preloading models before forking workers...")
+    try:
+        warmup_all_models()
+        server.log.info("Models preloaded")
+    except Exception as e:
+        # Workers still lazy-load on first use
+        server.log.warning(f"Model preload failed, falling back to lazy loading: {e}")
+
+    # Move everything loaded so far out of the cyclic GC's reach. Otherwise
+    # each worker's collections write to the headers of the model objects
+    # and un-share their pages, slowly turning the shared copy into
+    # per-worker copies.
+    gc.collect()
+    gc.freeze()
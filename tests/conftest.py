@@ -5,21 +5,129 @@ Pytest configuration and fixtures for VeriFact tests.
 import pytest
 import sys
 import os
+import zlib
+import numpy as np
+from types import MappingProxyType
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-@pytest.fixture
+# Shared model stand-ins: no unit test needs real keyword extraction or
+# embeddings, so no test run pays a model load (or a download). Modules
+# whose code paths reach the loaders request the stub_models fixture;
+# tests can still patch get_keybert_model / get_sbert_model themselves.
+class _KeyBERTStub:
+    """Fixed-output stand-in for KeyBERT (plain class: no mock bookkeeping)."""
+    
+    @staticmethod
+    def extract_keywords(*args, **kwargs):
+        return [("python", 0.9), ("code", 0.8)]
+
+
+class _SBERTStub:
+    """
+    Deterministic stand-in for SentenceTransformer.encode(): hashed
+    bag-of-words vectors, so texts sharing words are similar and unrelated
+    texts are close to orthogonal.
+    """
+    
+    DIM = 256
+    
+    @classmethod
+    def encode(cls, sentences, normalize_embeddings=False, **kwargs):
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else sentences
+        embs = np.zeros((len(texts), cls.DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                embs[row, zlib.crc32(word.encode()) % cls.DIM] += 1.0
+        if normalize_embeddings:
+            embs /= np.clip(np.linalg.norm(embs, axis=1, keepdims=True), 1e-12, None)
+        return embs[0] if single else embs
+
+
+_SHARED_KB_STUB = _KeyBERTStub()
+_SHARED_SBERT_STUB = _SBERTStub()
+
+
+def _apply_model_stubs(mp):
+    """Point the registry's KeyBERT and SBERT loaders at the shared stubs."""
+    mp.setattr("app.core.model_registry.get_keybert_model", lambda: _SHARED_KB_STUB)
+    mp.setattr("app.core.model_registry.get_sbert_model", lambda: _SHARED_SBERT_STUB)
+
+
+@pytest.fixture(scope="session")
+def stub_models():
+    """
+    Replace the KeyBERT and SBERT loaders with the shared stubs for the rest
+    of the session. Not autouse: patching imports model_registry (and with
+    it torch), which tests that never reach a model shouldn't pay for.
+    """
+    mp = pytest.MonkeyPatch()
+    _apply_model_stubs(mp)
+    yield
+    mp.undo()
+
+
+# Queries for SAMPLE_CLAIM (or the error generating them), computed before
+# the first test runs so the spaCy load and NER call stay out of the
+# timings of whichever query test happens to run first
+QUERIES_KEY = pytest.StashKey[object]()
+
+
+def pytest_collection_finish(session):
+    """Precompute generate_queries(SAMPLE_CLAIM) if any collected test uses it."""
+    if not any("queries_for_sample" in getattr(item, "fixturenames", ()) for item in session.items):
+        return
+    try:
+        from app.core.query_generator import generate_queries
+        # Runs before any fixture, so apply the model stubs here as well
+        with pytest.MonkeyPatch.context() as mp:
+            _apply_model_stubs(mp)
+            session.stash[QUERIES_KEY] = generate_queries(SAMPLE_CLAIM)
+    except Exception as e:
+        # Re-raised by the fixture so only the tests that need it fail
+        session.stash[QUERIES_KEY] = e
+
+
+def pytest_ignore_collect(collection_path, config):
+    """
+    With -m unit_fast, skip importing test modules that contain no unit_fast
+    tests, so the fast profile never loads their heavy imports (spaCy, torch).
+    """
+    if config.getoption("markexpr") != "unit_fast" or collection_path.suffix != ".py":
+        return None
+    if collection_path.name.startswith("test_") and "unit_fast" not in collection_path.read_text():
+        return True
+    return None
+
+
+@pytest.fixture(scope="session")
+def queries_for_sample(request):
+    """Precomputed queries for the sample claim."""
+    queries = request.session.stash[QUERIES_KEY]
+    if isinstance(queries, Exception):
+        raise queries
+    return queries
+
+
+# Sample data fixtures are built once per session; evidence dicts are
+# read-only views so a test can't leak mutations into later tests
+
+SAMPLE_CLAIM = "Python is a programming language"
+
+
+@pytest.fixture(scope="session")
 def sample_claim():
     """Sample claim for testing."""
-    return "Python is a programming language"
+    return SAMPLE_CLAIM
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evidence_supporting():
     """Sample supporting evidence."""
-    return {
+    return MappingProxyType({
         "url": "https://python.org",
         "best_sentence": "Python is a popular programming language.",
         "similarity": 0.92,
@@ -27,13 +135,13 @@ def sample_evidence_supporting():
         "stance_score": 0.95,
         "source_weight": 1.0,
         "is_social_media": False
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evidence_refuting():
     """Sample refuting evidence."""
-    return {
+    return MappingProxyType({
         "url": "https://example.com",
         "best_sentence": "Python is not a programming language, it is a snake.",
         "similarity": 0.75,
@@ -41,13 +149,13 @@ def sample_evidence_refuting():
         "stance_score": 0.88,
         "source_weight": 1.0,
         "is_social_media": False
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evidence_neutral():
     """Sample neutral evidence."""
-    return {
+    return MappingProxyType({
         "url": "https://news.com",
         "best_sentence": "Programming languages are used worldwide.",
         "similarity": 0.45,
@@ -55,13 +163,13 @@ def sample_evidence_neutral():
         "stance_score": 0.70,
         "source_weight": 1.0,
         "is_social_media": False
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_social_media_evidence():
     """Sample social media evidence with lower weight."""
-    return {
+    return MappingProxyType({
         "url": "https://twitter.com/user/status/123",
         "best_sentence": "Python is definitely a programming language!",
         "similarity": 0.88,
@@ -69,4 +177,4 @@ def sample_social_media_evidence():
         "stance_score": 0.90,
         "source_weight": 0.5,
         "is_social_media": True
-    }
+    })
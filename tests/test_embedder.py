@@ -0,0 +1,138 @@
+"""
+Unit tests for the Embedder module.
+"""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import patch
+from app.core.embedder import (
+    prune_near_duplicates,
+    encode_claim,
+    get_best_matching_sentences,
+    get_best_matching_sentences_batch,
+    _top_n_indices
+)
+
+
+def _fake_sbert(vectors):
+    """SBERT stand-in embedding each text as vectors[text] (already unit length)."""
+    def encode(texts, **kwargs):
+        if isinstance(texts, str):
+            return np.array(vectors[texts])
+        return np.array([vectors[t] for t in texts])
+    return SimpleNamespace(encode=encode)
+
+
+class TestPruneNearDuplicates:
+    """Tests for near-duplicate pruning."""
+
+    @patch('app.core.model_registry.get_sbert_model')
+    def test_shortest_of_cluster_kept_in_order(self, mock_get_sbert):
+        mock_get_sbert.return_value = _fake_sbert({
+            "claim": [1.0, 0.0, 0.0],
+            "tesla news verification": [0.0, 1.0, 0.0],
+            "tesla controversy": [0.0, 1.0, 0.0],
+            "musk news": [0.0, 0.0, 1.0],
+        })
+        texts = ["claim", "tesla news verification", "tesla controversy", "musk news"]
+
+        kept = prune_near_duplicates(texts, threshold=0.9, protected=1)
+
+        assert kept == ["claim", "tesla controversy", "musk news"]
+
+    @patch('app.core.model_registry.get_sbert_model')
+    def test_protected_texts_never_dropped(self, mock_get_sbert):
+        # Both templates are duplicates of each other and of the candidate
+        mock_get_sbert.return_value = _fake_sbert({
+            "claim": [1.0, 0.0],
+            "claim hoax": [1.0, 0.0],
+            "hoax": [1.0, 0.0],
+            "other": [0.0, 1.0],
+        })
+        texts = ["claim", "claim hoax", "hoax", "other"]
+
+        kept = prune_near_duplicates(texts, threshold=0.9, protected=2)
+
+        assert kept == ["claim", "claim hoax", "other"]
+
+    @patch('app.core.model_registry.get_sbert_model')
+    def test_only_protected_skips_encode(self, mock_get_sbert):
+        texts = ["claim", "claim hoax"]
+        assert prune_near_duplicates(texts, protected=2) == texts
+        mock_get_sbert.assert_not_called()
+
+
+# Claim along the first axis; each sentence's similarity is its first coordinate
+_CLAIM = "claim"
+_VECTORS = {_CLAIM: [1.0, 0.0]}
+_SIMS = {
+    "a1": 0.2, "a2": 0.9, "a3": 0.5, "a4": 0.7,
+    "b1": 0.4,
+    "c1": 0.3, "c2": 0.8,
+}
+_VECTORS.update({s: [sim, float(np.sqrt(1 - sim * sim))] for s, sim in _SIMS.items()})
+
+
+@pytest.fixture
+def fake_sbert(monkeypatch):
+    """Serve _VECTORS from SBERT; the claim embedding cache is cleared around the test."""
+    monkeypatch.setattr('app.core.model_registry.get_sbert_model', lambda: _fake_sbert(_VECTORS))
+    encode_claim.cache_clear()
+    yield
+    encode_claim.cache_clear()
+
+
+def _per_source_reference(sentences, top_n):
+    """Old per-source behaviour: score one source alone, full sort, best first."""
+    ranked = sorted(sentences, key=lambda s: _SIMS[s], reverse=True)
+    return [(s, _SIMS[s]) for s in ranked[:top_n]]
+
+
+class TestGetBestMatchingSentencesBatch:
+    """Tests for the flat batched encode and per-group top-N."""
+
+    @pytest.mark.usefixtures("fake_sbert")
+    def test_empty_group_in_the_middle(self):
+        groups = [["a1", "a2", "a3"], [], ["c1", "c2"]]
+
+        results = get_best_matching_sentences_batch(_CLAIM, groups, top_n=2)
+
+        assert len(results) == 3
+        assert [s for s, _ in results[0]] == ["a2", "a3"]
+        assert results[1] == []
+        assert [s for s, _ in results[2]] == ["c2", "c1"]
+
+    @pytest.mark.usefixtures("fake_sbert")
+    def test_all_groups_empty(self):
+        assert get_best_matching_sentences_batch(_CLAIM, [[], []]) == [[], []]
+
+    @pytest.mark.usefixtures("fake_sbert")
+    def test_top_n_at_least_group_size(self):
+        results = get_best_matching_sentences_batch(_CLAIM, [["b1"], ["c1", "c2"]], top_n=5)
+
+        assert [s for s, _ in results[0]] == ["b1"]
+        assert [s for s, _ in results[1]] == ["c2", "c1"]
+
+    @pytest.mark.usefixtures("fake_sbert")
+    @pytest.mark.parametrize("top_n", [1, 3, 10])
+    def test_matches_per_source_results(self, top_n):
+        groups = [["a1", "a2", "a3", "a4"], [], ["b1"], ["c1", "c2"]]
+
+        batched = get_best_matching_sentences_batch(_CLAIM, groups, top_n=top_n)
+
+        for group, result in zip(groups, batched):
+            expected = _per_source_reference(group, top_n)
+            assert [s for s, _ in result] == [s for s, _ in expected]
+            assert [score for _, score in result] == pytest.approx([score for _, score in expected], abs=1e-6)
+            assert result == get_best_matching_sentences(_CLAIM, group, top_n=top_n)
+
+
+class TestTopNIndices:
+    """Tests for argpartition-based top-N selection."""
+
+    @pytest.mark.parametrize("top_n", [1, 2, 4, 6])
+    def test_best_first(self, top_n):
+        scores = np.array([0.1, 0.9, 0.4, 0.7])
+        expected = np.argsort(-scores, kind="stable")[:top_n]
+        assert _top_n_indices(scores, top_n).tolist() == expected.tolist()
@@ -0,0 +1,57 @@
+"""
+Unit tests for the Evidence Aggregator module.
+"""
+
+from app.core.evidence_aggregator import build_evidence
+
+
+class TestBuildEvidence:
+    """Tests for the batched stance scatter in build_evidence."""
+
+    def test_stances_scattered_back_to_their_sources(self, monkeypatch):
+        """One NLI call over all candidates; each source gets only its own stances."""
+        sources = [
+            ("http://a.com", ["a1", "a2"]),
+            ("http://b.com", ["b1"]),
+            ("http://c.com", ["c1", "c2", "c3"]),
+        ]
+        top_per_source = [
+            [("a1", 0.9), ("a2", 0.8)],
+            # Below SIMILARITY_THRESHOLD: no stance candidates
+            [("b1", 0.1)],
+            [("c1", 0.7), ("c2", 0.6), ("c3", 0.5)],
+        ]
+        # Stance label and confidence identify the sentence they were computed for
+        labels = {"a": "supports", "c": "refutes"}
+        calls = []
+
+        async def fake_fetch_all(search_results, executor):
+            return sources
+
+        def fake_detect(sentences, claim):
+            calls.append(list(sentences))
+            return [
+                {"label": labels[s[0]], "confidence": int(s[1]) / 10}
+                for s in sentences
+            ]
+
+        monkeypatch.setattr('app.core.evidence_aggregator._fetch_all_sources', fake_fetch_all)
+        monkeypatch.setattr(
+            'app.core.evidence_aggregator.get_best_matching_sentences_batch',
+            lambda claim, groups, top_n: top_per_source
+        )
+        monkeypatch.setattr('app.core.evidence_aggregator.batch_detect_stance', fake_detect)
+
+        evidences = build_evidence("claim", [{"href": url} for url, _ in sources])
+
+        assert calls == [["a1", "a2", "c1", "c2", "c3"]]
+        a, b, c = evidences
+        assert (a["url"], a["stance"]) == ("http://a.com", "supports")
+        assert [s["sentence"] for s in a["supporting_sentences"]] == ["a2"]
+        assert a["supporting_sentences"][0]["confidence"] == 0.2
+        assert (b["url"], b["stance"], b["stance_score"]) == ("http://b.com", "discusses", 0.0)
+        assert b["supporting_sentences"] == []
+        assert (c["url"], c["stance"]) == ("http://c.com", "refutes")
+        assert [(s["sentence"], s["similarity"], s["confidence"]) for s in c["supporting_sentences"]] == [
+            ("c2", 0.6, 0.2), ("c3", 0.5, 0.3)
+        ]
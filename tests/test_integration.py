@@ -3,41 +3,90 @@ Integration tests for the Flask Application.
 """
 
 import pytest
-from app_flask import app
+from concurrent.futures import ThreadPoolExecutor
+from flask import g
+import app_flask
+from app_flask import app, limiter
 from unittest.mock import patch
 
-@pytest.fixture
-def client():
-    app.config['TESTING'] = True
+app.config['TESTING'] = True
+
+
+@pytest.fixture(scope="session")
+def app_context():
+    """
+    One app context for the whole session; requests from the test client
+    reuse it instead of pushing their own.
+    """
+    ctx = app.app_context()
+    ctx.push()
+    yield ctx
+    ctx.pop()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def limiter_disabled():
+    """
+    The API tests call /api/check more often than its per-minute limit
+    allows; rate limiting is restored after this module.
+    """
+    enabled = limiter.enabled
+    limiter.enabled = False
+    yield
+    limiter.enabled = enabled
+
+
+@pytest.fixture(autouse=True)
+def fresh_g(app_context):
+    """Requests share the session app context, so clear flask.g between tests."""
+    yield
+    for name in list(vars(g)):
+        delattr(g, name)
+
+
+@pytest.fixture(scope="class")
+def client(app_context):
+    """One test client per test class; none of the API tests change app config."""
     with app.test_client() as client:
         yield client
 
+
 class TestAPIIntegration:
     """End-to-end API tests with mocked internals."""
     
-    def test_health_check(self, client):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _attach_client(cls, client):
+        """Expose the shared client as self.client instead of a per-test argument."""
+        cls.client = client
+        yield
+        del cls.client
+    
+    def test_health_check(self):
         """Health check should return 200 and valid JSON."""
-        rv = client.get('/api/health')
+        rv = self.client.get('/api/health')
         assert rv.status_code == 200
         data = rv.get_json()
         assert data['status'] == 'healthy'
         assert 'uptime_seconds' in data
         
-    def test_index_route(self, client):
+    def test_index_route(self):
         """Root route should serve index.html."""
-        rv = client.get('/')
+        rv = self.client.get('/')
         assert rv.status_code == 200
 
-    def test_check_claim_validation_error(self, client):
+    def test_check_claim_validation_error(self):
         """Should fail if no input provided."""
-        rv = client.post('/api/check', json={})
+        rv = self.client.post('/api/check', json={})
         assert rv.status_code == 400
         assert 'error' in rv.get_json()
 
+    @patch('app_flask.generate_queries', return_value=["the earth is flat"])
+    @patch('app_flask.prepare_claim')
     @patch('app_flask.web_search')
     @patch('app_flask.build_evidence')
     @patch('app_flask.compute_final_verdict')
-    def test_check_claim_success(self, mock_verdict, mock_evidence, mock_search, client):
+    def test_check_claim_success(self, mock_verdict, mock_evidence, mock_search, mock_prepare, mock_queries):
         """Should process valid claim successfully."""
         # Mock pipeline responses
         mock_search.return_value = []
@@ -54,15 +103,143 @@ class TestAPIIntegration:
             "max_results": 3
         }
         
-        rv = client.post('/api/check', json=payload)
+        rv = self.client.post('/api/check', json=payload)
         
         assert rv.status_code == 200
         data = rv.get_json()
         assert data['status'] == 'success'
         assert data['verdict'] == 'UNVERIFIED'
+        mock_prepare.assert_called_once_with("The earth is flat")
+    
+    @patch('app_flask.generate_queries', return_value=["the earth is flat"])
+    @patch('app_flask.prepare_claim', side_effect=RuntimeError("model load failed"))
+    @patch('app_flask.web_search')
+    @patch('app_flask.build_evidence')
+    @patch('app_flask.compute_final_verdict')
+    def test_prepare_claim_failure_does_not_fail_request(
+        self, mock_verdict, mock_evidence, mock_search, mock_prepare, mock_queries
+    ):
+        """A failed claim prep overlap is logged; evidence is still built."""
+        mock_search.return_value = [{"href": "http://a.com", "title": "A", "body": "Body"}]
+        mock_evidence.return_value = []
+        mock_verdict.return_value = {
+            "verdict": "UNVERIFIED",
+            "confidence": 0.0,
+            "net_score": 0.0,
+            "explanation": "No evidence found"
+        }
+        
+        rv = self.client.post('/api/check', json={"claim": "The earth is flat"})
+        
+        assert rv.status_code == 200
+        mock_prepare.assert_called_once_with("The earth is flat")
+        mock_evidence.assert_called_once_with("The earth is flat", mock_search.return_value)
         
-    def test_check_claim_invalid_url(self, client):
+    def test_check_claim_invalid_url(self):
         """Should reject invalid URLs."""
         payload = {"url": "htt://bad-url", "max_results": 3}
-        rv = client.post('/api/check', json=payload)
+        rv = self.client.post('/api/check', json=payload)
+        assert rv.status_code == 400
+    
+    @pytest.mark.parametrize("payload,field", [
+        pytest.param({"claim": "The earth is flat", "max_results": 0}, "max_results", id="max-results-0"),
+        pytest.param({"claim": "The earth is flat", "max_results": 11}, "max_results", id="max-results-11"),
+        pytest.param({"claim": "The earth is flat", "max_results": True}, "max_results", id="bool-rejected"),
+        pytest.param({"url": "ftp://example.com/a"}, "url", id="non-http-url"),
+        pytest.param({"claim": 5}, "claim", id="claim-not-string"),
+    ])
+    def test_check_claim_validation_details(self, payload, field):
+        """Invalid fields return 400 with message strings naming the field."""
+        rv = self.client.post('/api/check', json=payload)
         assert rv.status_code == 400
+        data = rv.get_json()
+        assert data['error'] == 'Validation error'
+        assert len(data['details']) == 1
+        assert data['details'][0].endswith(f"at `$.{field}`")
+    
+    @pytest.mark.parametrize("body", [b"{not json", b""])
+    def test_check_claim_malformed_json(self, body):
+        """A body that isn't JSON is rejected before validation."""
+        rv = self.client.post('/api/check', data=body, content_type='application/json')
+        assert rv.status_code == 400
+        assert rv.get_json() == {'error': 'Request body must be JSON'}
+    
+    @patch('app_flask.generate_queries', return_value=["the earth is flat"])
+    @patch('app_flask.prepare_claim')
+    @patch('app_flask.web_search', return_value=[])
+    @patch('app_flask.build_evidence', return_value=[])
+    @patch('app_flask.compute_final_verdict')
+    def test_check_claim_numeric_string_coerced(
+        self, mock_verdict, mock_evidence, mock_search, mock_prepare, mock_queries
+    ):
+        """max_results "3" is accepted as 3 (lax decoding)."""
+        mock_verdict.return_value = {
+            "verdict": "UNVERIFIED",
+            "confidence": 0.0,
+            "net_score": 0.0,
+            "explanation": "No evidence found"
+        }
+        
+        rv = self.client.post('/api/check', json={"claim": "The earth is flat", "max_results": "3"})
+        
+        assert rv.status_code == 200
+        mock_search.assert_called_once_with(["the earth is flat"], max_results=3)
+    
+    def test_cache_clear_disabled_without_token(self, monkeypatch):
+        """Cache clearing is off unless CACHE_ADMIN_TOKEN is configured."""
+        monkeypatch.setattr('app_flask.CACHE_ADMIN_TOKEN', '')
+        rv = self.client.post('/api/cache/clear', headers={'Authorization': 'Bearer '})
+        assert rv.status_code == 404
+    
+    @pytest.mark.parametrize("headers", [
+        pytest.param({}, id="missing"),
+        pytest.param({'Authorization': 'Bearer wrong'}, id="wrong-token"),
+        pytest.param({'Authorization': 'secret'}, id="not-bearer"),
+    ])
+    @patch('app.core.web_search.clear_search_cache')
+    def test_cache_clear_rejects_bad_token(self, mock_clear, monkeypatch, headers):
+        monkeypatch.setattr('app_flask.CACHE_ADMIN_TOKEN', 'secret')
+        rv = self.client.post('/api/cache/clear', headers=headers)
+        assert rv.status_code == 401
+        mock_clear.assert_not_called()
+    
+    @patch('app.core.web_search.clear_search_cache')
+    def test_cache_clear_with_token(self, mock_clear, monkeypatch):
+        monkeypatch.setattr('app_flask.CACHE_ADMIN_TOKEN', 'secret')
+        rv = self.client.post('/api/cache/clear', headers={'Authorization': 'Bearer secret'})
+        assert rv.status_code == 200
+        assert rv.get_json()['status'] == 'cleared'
+        mock_clear.assert_called_once()
+    
+    @patch('app.core.web_search.clear_search_cache')
+    def test_cache_clear_rate_limited(self, mock_clear, monkeypatch):
+        """The sixth cache clear within a minute is rejected."""
+        monkeypatch.setattr('app_flask.CACHE_ADMIN_TOKEN', 'secret')
+        monkeypatch.setattr(limiter, 'enabled', True)
+        limiter.reset()
+        try:
+            codes = [
+                self.client.post('/api/cache/clear', headers={'Authorization': 'Bearer secret'}).status_code
+                for _ in range(6)
+            ]
+        finally:
+            limiter.reset()
+        
+        assert codes == [200] * 5 + [429]
+        assert mock_clear.call_count == 5
+
+
+class TestMetrics:
+    """Tests for the health counters."""
+
+    def test_concurrent_increments_not_lost(self):
+        """Every increment from concurrent workers shows up in /api/health."""
+        before = app_flask.REQUEST_COUNT
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(2000):
+                pool.submit(app_flask.increment_request_count)
+
+        with app.test_client() as client:
+            data = client.get('/api/health').get_json()
+
+        assert data['requests_processed'] == before + 2000
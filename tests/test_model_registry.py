@@ -0,0 +1,70 @@
+"""
+Unit tests for the Model Registry precision selection.
+"""
+
+import pytest
+import torch
+from app.core import model_registry
+from app.core.model_registry import _cpu_supports_bf16, _reduce_sbert_precision
+
+
+def _tiny_model():
+    return torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+
+class TestReduceSbertPrecision:
+    """Tests for SBERT_PRECISION handling."""
+
+    @pytest.mark.parametrize("setting,bf16_cpu,expected", [
+        pytest.param(None, True, "bf16", id="auto-bf16-cpu"),
+        pytest.param(None, False, "fp32", id="auto-no-bf16-stays-fp32"),
+        pytest.param("auto", False, "fp32", id="explicit-auto-no-bf16"),
+        pytest.param("fp32", True, "fp32", id="forced-fp32"),
+        pytest.param("bf16", False, "bf16", id="forced-bf16"),
+        pytest.param("INT8", False, "int8", id="forced-int8"),
+    ])
+    def test_precision_selection(self, monkeypatch, setting, bf16_cpu, expected):
+        if setting is None:
+            monkeypatch.delenv("SBERT_PRECISION", raising=False)
+        else:
+            monkeypatch.setenv("SBERT_PRECISION", setting)
+        monkeypatch.setattr(model_registry, "_cpu_supports_bf16", lambda: bf16_cpu)
+
+        model, precision = _reduce_sbert_precision(_tiny_model())
+
+        assert precision == expected
+        linear = model[0]
+        if expected == "int8":
+            assert not isinstance(linear, torch.nn.Linear)
+        else:
+            dtype = torch.bfloat16 if expected == "bf16" else torch.float32
+            assert linear.weight.dtype == dtype
+
+
+class TestCpuSupportsBf16:
+    """Tests for the torch capability probe."""
+
+    @pytest.fixture
+    def probe(self, monkeypatch):
+        """Replace both torch probe names; returns a setter for the active one."""
+        monkeypatch.delattr(torch.cpu, "_is_cpu_support_avx512_bf16", raising=False)
+
+        def set_probe(func):
+            monkeypatch.setattr(torch.cpu, "_is_avx512_bf16_supported", func, raising=False)
+        return set_probe
+
+    @pytest.mark.parametrize("supported", [True, False])
+    def test_reports_probe(self, probe, supported):
+        probe(lambda: supported)
+        assert _cpu_supports_bf16() is supported
+
+    def test_probe_error_means_unsupported(self, probe):
+        def broken():
+            raise RuntimeError("no cpuinfo")
+        probe(broken)
+        assert _cpu_supports_bf16() is False
+
+    def test_missing_probe_means_unsupported(self, monkeypatch):
+        monkeypatch.delattr(torch.cpu, "_is_avx512_bf16_supported", raising=False)
+        monkeypatch.delattr(torch.cpu, "_is_cpu_support_avx512_bf16", raising=False)
+        assert _cpu_supports_bf16() is False
@@ -0,0 +1,161 @@
+"""
+Unit tests for the Scraper module.
+"""
+
+import pytest
+import asyncio
+import httpx
+from app.core.scraper import (
+    MAX_HTML_BYTES,
+    canonicalize_url,
+    clear_article_cache,
+    fetch_html,
+    fetch_html_async,
+    scrape_article,
+    scrape_article_async
+)
+
+
+def _async_client(content: bytes, requests: list = None) -> httpx.AsyncClient:
+    """Async client whose every request returns 200 with the given body."""
+    def handler(request):
+        if requests is not None:
+            requests.append(str(request.url))
+        return httpx.Response(200, content=content)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _scrape_async(url: str, content: bytes, requests: list = None) -> str:
+    async def scrape():
+        async with _async_client(content, requests) as client:
+            return await scrape_article_async(client, url)
+    return asyncio.run(scrape())
+
+
+@pytest.fixture
+def empty_cache():
+    clear_article_cache()
+    yield
+    clear_article_cache()
+
+
+class TestCanonicalizeUrl:
+    """Tests for cache key normalization."""
+
+    @pytest.mark.parametrize("url,expected", [
+        pytest.param("https://News.Example.com/a", "https://news.example.com/a", id="host-lowercased"),
+        pytest.param("https://example.com/a?utm_source=x&utm_medium=y", "https://example.com/a", id="utm"),
+        pytest.param("https://example.com/a?fbclid=abc", "https://example.com/a", id="fbclid"),
+        pytest.param("https://example.com/a?gclid=abc", "https://example.com/a", id="gclid"),
+        pytest.param("https://example.com/a?id=7&utm_campaign=z&page=2", "https://example.com/a?id=7&page=2",
+                     id="other-params-kept-in-order"),
+        pytest.param("https://example.com/a?q=", "https://example.com/a?q=", id="blank-value-kept"),
+        pytest.param("https://example.com/a#section", "https://example.com/a", id="fragment-dropped"),
+        pytest.param("https://example.com/Path/A", "https://example.com/Path/A", id="path-case-kept"),
+    ])
+    def test_canonicalize(self, url, expected):
+        assert canonicalize_url(url) == expected
+
+    def test_idempotent(self):
+        url = canonicalize_url("https://Example.com/a?b=1&utm_x=2#top")
+        assert canonicalize_url(url) == url
+
+
+@pytest.mark.usefixtures("empty_cache")
+class TestArticleCache:
+    """Tests for the extracted-text cache shared by the sync and async paths."""
+
+    def test_sync_cache_hit_skips_fetch(self, monkeypatch):
+        fetched = []
+        monkeypatch.setattr('app.core.scraper.fetch_html', lambda url: fetched.append(url) or b"<html></html>")
+        monkeypatch.setattr('app.core.scraper._extract_text', lambda html, url: "Article text")
+
+        assert scrape_article("https://example.com/a?utm_source=x") == "Article text"
+        assert scrape_article("https://EXAMPLE.com/a#comments") == "Article text"
+
+        assert len(fetched) == 1
+
+    def test_async_cache_hit_skips_fetch(self, monkeypatch):
+        requests = []
+        monkeypatch.setattr('app.core.scraper._extract_text', lambda html, url: "Article text")
+
+        assert _scrape_async("https://example.com/a", b"<html></html>", requests) == "Article text"
+        assert _scrape_async("https://example.com/a?fbclid=1", b"<html></html>", requests) == "Article text"
+
+        assert requests == ["https://example.com/a"]
+
+    def test_sync_result_served_to_async_path(self, monkeypatch):
+        requests = []
+        monkeypatch.setattr('app.core.scraper.fetch_html', lambda url: b"<html></html>")
+        monkeypatch.setattr('app.core.scraper._extract_text', lambda html, url: "Article text")
+
+        scrape_article("https://example.com/a")
+
+        assert _scrape_async("https://example.com/a", b"<html></html>", requests) == "Article text"
+        assert requests == []
+
+    @pytest.mark.parametrize("body,extracted", [
+        pytest.param(b"", "Article text", id="empty-fetch"),
+        pytest.param(b"<html></html>", "", id="empty-extraction"),
+    ])
+    def test_empty_results_not_cached(self, monkeypatch, body, extracted):
+        fetched = []
+        requests = []
+        monkeypatch.setattr('app.core.scraper.fetch_html', lambda url: fetched.append(url) or body)
+        monkeypatch.setattr('app.core.scraper._extract_text', lambda html, url: extracted)
+
+        assert scrape_article("https://example.com/a") == ""
+        assert scrape_article("https://example.com/a") == ""
+        assert _scrape_async("https://example.com/a", body, requests) == ""
+        assert _scrape_async("https://example.com/a", body, requests) == ""
+
+        assert len(fetched) == 2
+        assert len(requests) == 2
+
+    def test_fetch_error_not_cached(self, monkeypatch):
+        calls = []
+
+        def fetch(url):
+            calls.append(url)
+            if len(calls) == 1:
+                raise httpx.ConnectError("unreachable")
+            return b"<html></html>"
+        monkeypatch.setattr('app.core.scraper.fetch_html', fetch)
+        monkeypatch.setattr('app.core.scraper._extract_text', lambda html, url: "Article text")
+
+        assert scrape_article("https://example.com/a") == ""
+        assert scrape_article("https://example.com/a") == "Article text"
+
+
+class TestFetchHtml:
+    """Tests for the capped sync page fetch."""
+
+    def test_large_page_truncated(self, monkeypatch):
+        """Page bodies should be read only up to max_bytes."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"x" * 300_000))
+        with httpx.Client(transport=transport) as client:
+            monkeypatch.setattr('app.core.scraper.get_client', lambda: client)
+            html = fetch_html("http://example.com", max_bytes=100_000)
+
+        assert len(html) == 100_000
+
+
+class TestFetchHtmlAsync:
+    """Tests for the capped async page fetch."""
+
+    def test_large_page_truncated(self):
+        """Async page bodies should be read only up to max_bytes."""
+        async def fetch():
+            async with _async_client(b"x" * 300_000) as client:
+                return await fetch_html_async(client, "http://example.com", max_bytes=100_000)
+
+        assert len(asyncio.run(fetch())) == 100_000
+
+    @pytest.mark.usefixtures("empty_cache")
+    def test_scrape_uses_capped_fetch(self, monkeypatch):
+        """scrape_article_async should extract from the body capped at MAX_HTML_BYTES."""
+        seen = []
+        monkeypatch.setattr('app.core.scraper._extract_text', lambda html, url: seen.append(html) or "Text")
+
+        assert _scrape_async("http://example.com/big", b"x" * (MAX_HTML_BYTES + 100_000)) == "Text"
+        assert len(seen[0]) == MAX_HTML_BYTES
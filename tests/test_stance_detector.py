@@ -0,0 +1,186 @@
+"""
+Unit tests for the Stance Detector module.
+"""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+from app.core.stance_detector import (
+    detect_stance,
+    batch_detect_stance,
+    clear_stance_cache,
+    prewarm_claim,
+    _build_hypotheses,
+    _templated_hypotheses,
+    _entailment_scores,
+    _pair_features_from_ids
+)
+
+
+def fake_scores(nli_classifier, premises, hypotheses):
+    """NLI stub: premises containing 'not' contradict, others support."""
+    return np.array([
+        [0.15, 0.8, 0.05] if " not " in premise else [0.8, 0.15, 0.05]
+        for premise in premises
+    ])
+
+
+class TestBatchDetectStance:
+    """Tests for batched stance detection."""
+    
+    @pytest.fixture
+    def classifier(self):
+        clear_stance_cache()
+        mock = MagicMock(side_effect=fake_scores)
+        with patch('app.core.model_registry.get_nli_classifier', return_value=(SimpleNamespace(), "deberta")), \
+                patch('app.core.stance_detector._entailment_scores', mock):
+            yield mock
+    
+    def test_single_pipeline_call(self, classifier):
+        """All premises should go through one model call."""
+        results = batch_detect_stance(
+            ["Python is a language.", "Python is not a language.", "It is popular."],
+            "Python is a language"
+        )
+        
+        assert classifier.call_count == 1
+        assert [r["label"] for r in results] == ["supports", "refutes", "supports"]
+    
+    def test_empty_premises_aligned(self, classifier):
+        """Empty premises should stay neutral and keep result alignment."""
+        results = batch_detect_stance(["", "Python is not a language."], "Python is a language")
+        
+        assert results[0] == {"label": "neutral", "confidence": 0}
+        assert results[1]["label"] == "refutes"
+        assert classifier.call_args[0][1] == ["Python is not a language."]
+    
+    def test_empty_claim(self, classifier):
+        """Empty claim should skip the model entirely."""
+        assert batch_detect_stance(["Some evidence."], "") == [{"label": "neutral", "confidence": 0}]
+        classifier.assert_not_called()
+    
+    def test_detect_stance_delegates(self, classifier):
+        """Single-premise detection should use the batched path."""
+        result = detect_stance("Python is a language.", "Python is a language")
+        
+        assert result["label"] == "supports"
+        assert 0 < result["confidence"] <= 1
+    
+    def test_cached_results_skip_model(self, classifier):
+        """Repeated premise/claim pairs should be served from the cache."""
+        first = batch_detect_stance(["Python is not a language."], "Python is a language")
+        second = batch_detect_stance(
+            ["Python is not a language.", "It is popular."], "Python is a language"
+        )
+        
+        assert second[0] == first[0]
+        assert classifier.call_count == 2
+        assert classifier.call_args[0][1] == ["It is popular."]
+
+
+class TestPrewarmClaim:
+    """Tests for preparing NLI inputs ahead of stance detection."""
+    
+    def test_hypotheses_tokenized_once(self):
+        tokenizer = MagicMock()
+        tokenizer.return_value = {"input_ids": [[1], [2], [3]]}
+        nli_classifier = SimpleNamespace(tokenizer=tokenizer)
+        with patch('app.core.model_registry.get_nli_classifier', return_value=(nli_classifier, "deberta")):
+            prewarm_claim(" Python is a language ")
+            prewarm_claim("Python is a language")
+        
+        assert tokenizer.call_count == 1
+        hypotheses = tokenizer.call_args[0][0]
+        assert hypotheses[0] == "This example is This supports the claim: Python is a language."
+
+
+_VOCAB = [
+    "[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]",
+    "this", "example", "is", "supports", "contradicts", "unrelated", "to", "the", "claim",
+    "python", "a", "language", "not", "snake", "popular", "very", "old", ":", ".",
+]
+
+
+@pytest.fixture(scope="module")
+def bert_tokenizer(tmp_path_factory):
+    """
+    Tiny local Python BERT tokenizer (no download), which supports id-level
+    pair assembly; short max length to force truncation.
+    """
+    try:
+        # transformers 5: BertTokenizer is tokenizers-backed only
+        from transformers.models.bert.tokenization_bert_legacy import BertTokenizerLegacy as PyBertTokenizer
+    except ImportError:
+        from transformers import BertTokenizer as PyBertTokenizer
+    
+    vocab_file = tmp_path_factory.mktemp("bert") / "vocab.txt"
+    vocab_file.write_text("\n".join(_VOCAB) + "\n")
+    return PyBertTokenizer(str(vocab_file), model_max_length=32)
+
+
+def _pair_logit(input_ids):
+    """Deterministic entailment logit of one (unpadded) pair."""
+    return sum((pos + 1) * tok for pos, tok in enumerate(input_ids)) / 1000.0
+
+
+class _FakeNLIModel:
+    """Returns fixed entailment logits computed from each row's real (unpadded) tokens."""
+    
+    device = "cpu"
+    
+    def __call__(self, input_ids, attention_mask, **kwargs):
+        import torch
+        
+        rows = [
+            _pair_logit(ids[:int(mask.sum())].tolist())
+            for ids, mask in zip(input_ids, attention_mask)
+        ]
+        entail = torch.tensor(rows, dtype=torch.float32)
+        return SimpleNamespace(logits=torch.stack([entail, torch.zeros_like(entail)], dim=1))
+
+
+class TestEntailmentScores:
+    """Tests for id-level pair assembly and batched NLI scoring."""
+    
+    SHORT_PREMISE = "python is a language."
+    LONG_PREMISE = " ".join(["python is a very old popular language"] * 6) + "."
+    
+    def test_pair_features_match_tokenizer(self, bert_tokenizer):
+        """Pairs built from ids equal tokenizer(p, h, truncation="only_first")."""
+        hypotheses = _templated_hypotheses(_build_hypotheses("python is a language"))
+        premises = [self.SHORT_PREMISE, self.LONG_PREMISE]
+        
+        features = _pair_features_from_ids(bert_tokenizer, premises, hypotheses)
+        
+        expected = [
+            bert_tokenizer(p, h, truncation="only_first")
+            for p in premises for h in hypotheses
+        ]
+        # Same inputs the tokenizer produces (token_type_ids only if it emits them)
+        assert features == [
+            {k: v for k, v in e.items() if k != "attention_mask"} for e in expected
+        ]
+        # The long premise really was truncated to the model max length
+        assert len(features[-1]["input_ids"]) == bert_tokenizer.model_max_length
+    
+    def test_scores_in_input_order(self, monkeypatch, bert_tokenizer):
+        """Length-sorted batches are scattered back to premise/hypothesis order."""
+        assert hasattr(bert_tokenizer, "build_inputs_with_special_tokens")  # id-level path
+        # Batches of 2 pairs, so sorting by length reorders across batches
+        monkeypatch.setattr('app.core.stance_detector.NLI_BATCH_SIZE', 2)
+        nli = SimpleNamespace(tokenizer=bert_tokenizer, model=_FakeNLIModel(), entailment_id=0)
+        hypotheses = _build_hypotheses("python is a language")
+        premises = [self.LONG_PREMISE, "python is not a snake.", self.SHORT_PREMISE]
+        
+        scores = _entailment_scores(nli, premises, hypotheses)
+        
+        logits = np.array([
+            [_pair_logit(bert_tokenizer(p, h, truncation="only_first")["input_ids"])
+             for h in _templated_hypotheses(hypotheses)]
+            for p in premises
+        ])
+        expected = np.exp(logits - logits.max(axis=1, keepdims=True))
+        expected /= expected.sum(axis=1, keepdims=True)
+        assert scores.shape == (3, 3)
+        np.testing.assert_allclose(scores, expected, rtol=1e-5)
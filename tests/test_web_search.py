@@ -3,55 +3,144 @@ Unit tests for the Web Search module.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
-import os
-from app.core.web_search import web_search, is_social_media
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.core.web_search import (
+    web_search,
+    is_social_media,
+    clear_search_cache,
+    _tavily_search,
+    _brave_search
+)
 
 class TestIsSocialMedia:
-    def test_social_domains(self):
-        assert is_social_media("https://twitter.com/user/123")
-        assert is_social_media("https://www.facebook.com/post")
-        assert is_social_media("https://reddit.com/r/news")
-        
-    def test_news_domains(self):
-        assert not is_social_media("https://cnn.com/article")
-        assert not is_social_media("https://bbc.co.uk")
+    @pytest.mark.parametrize("url", [
+        "https://twitter.com/user/123",
+        "https://www.facebook.com/post",
+        "https://reddit.com/r/news",
+        "https://old.reddit.com/r/news",
+        "HTTPS://X.COM/user",
+    ])
+    def test_social_domains(self, url):
+        assert is_social_media(url)
+    
+    @pytest.mark.parametrize("url", [
+        "https://cnn.com/article",
+        "https://bbc.co.uk",
+        # Domain mentioned outside the host
+        "https://example.com/share?via=twitter.com",
+        "https://netflix.com/title",
+        "not a url",
+    ])
+    def test_not_social_domains(self, url):
+        assert not is_social_media(url)
 
 class TestWebSearch:
     """Tests for the fallback search logic."""
     
-    @patch.dict(os.environ, {"TAVILY_API_KEY": "fake_key"})
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        clear_search_cache()
+        yield
+        clear_search_cache()
+    
+    @pytest.fixture(scope="class")
+    @classmethod
+    def env_patch(cls):
+        """One MonkeyPatch for the class; env changes are undone at class teardown."""
+        mp = pytest.MonkeyPatch()
+        yield mp
+        mp.undo()
+    
+    # API key setups; each sets or clears both keys, so nothing an earlier
+    # test set in the shared env_patch leaks into the next one
+    @pytest.fixture
+    def tavily_env(self, env_patch):
+        env_patch.setenv("TAVILY_API_KEY", "fake_key")
+        env_patch.delenv("BRAVE_API_KEY", raising=False)
+    
+    @pytest.fixture
+    def brave_env(self, env_patch):
+        env_patch.delenv("TAVILY_API_KEY", raising=False)
+        env_patch.setenv("BRAVE_API_KEY", "fake_key")
+    
+    @pytest.fixture
+    def ddg_env(self, env_patch):
+        env_patch.delenv("TAVILY_API_KEY", raising=False)
+        env_patch.delenv("BRAVE_API_KEY", raising=False)
+    
+    @pytest.fixture
+    def backend(self, request, monkeypatch):
+        """Env for the requested backend plus a mock of its search function."""
+        name = request.param
+        request.getfixturevalue(f"{name}_env")
+        url = f"http://{name}.com"
+        mock = MagicMock(return_value=[{"href": url, "title": name, "body": "Content"}])
+        monkeypatch.setattr(f"app.core.web_search._{name}_search", mock)
+        return mock, url
+    
+    @pytest.mark.parametrize("backend", ["tavily", "brave", "ddg"], indirect=True)
+    def test_backend_priority(self, backend):
+        """Tavily if its key is set, then Brave, then DDG with no keys."""
+        mock, expected_url = backend
+        
+        results = web_search(["query"])
+        
+        mock.assert_called_once()
+        assert len(results) == 1
+        assert results[0]['href'] == expected_url
+
+    @pytest.mark.usefixtures("tavily_env")
     @patch('app.core.web_search._tavily_search')
-    def test_tavily_priority(self, mock_tavily):
-        """Should use Tavily if key is present."""
+    def test_results_cached_by_normalized_queries(self, mock_tavily):
+        """Repeat searches (any order/case) are served from the cache."""
         mock_tavily.return_value = [{"href": "http://test.com", "title": "Test", "body": "Content"}]
         
-        results = web_search(["query"])
+        first = web_search(["Query A", "query b"])
+        first[0]['title'] = "mutated"
+        second = web_search([" query b", "query a "])
         
         mock_tavily.assert_called_once()
-        assert len(results) == 1
-        assert results[0]['href'] == "http://test.com"
+        assert second[0]['title'] == "Test"
+        
+        web_search(["query a", "query b"], max_results=3)
+        assert mock_tavily.call_count == 2
 
-    @patch.dict(os.environ, {"TAVILY_API_KEY": ""})  # No Tavily key
-    @patch.dict(os.environ, {"BRAVE_API_KEY": "fake_key"})
-    @patch('app.core.web_search._brave_search')
-    def test_brave_fallback(self, mock_brave):
-        """Should fallback to Brave if Tavily key missing."""
-        mock_brave.return_value = [{"href": "http://brave.com", "title": "Brave", "body": "Content"}]
+    @patch('app.core.web_search._tavily_limiter')
+    @patch('app.core.web_search._get_tavily_client')
+    def test_parallel_results_merged_in_query_order(self, mock_client, mock_limiter):
+        """Concurrent per-query results keep query order and drop duplicate URLs."""
+        def search(query, **kwargs):
+            return {"results": [
+                {"url": f"http://{query}.com", "title": query},
+                {"url": "http://shared.com", "title": "Shared"},
+            ]}
+        mock_client.return_value.search.side_effect = search
         
-        results = web_search(["query"])
+        results = _tavily_search(["a", "b", "c"])
         
-        mock_brave.assert_called_once()
-        assert results[0]['href'] == "http://brave.com"
+        assert [r['href'] for r in results] == [
+            "http://a.com", "http://shared.com", "http://b.com", "http://c.com"
+        ]
+        assert mock_limiter.wait.call_count == 3
 
-    @patch.dict(os.environ, {"TAVILY_API_KEY": ""})
-    @patch.dict(os.environ, {"BRAVE_API_KEY": ""})
-    @patch('app.core.web_search._ddg_search')
-    def test_ddg_fallback(self, mock_ddg):
-        """Should fallback to DDG if no keys present."""
-        mock_ddg.return_value = [{"href": "http://ddg.com", "title": "DDG", "body": "Content"}]
+    @pytest.mark.usefixtures("brave_env")
+    @patch('app.core.web_search._brave_limiter')
+    @patch('app.core.web_search._brave_async_client')
+    def test_brave_async_queries_gathered(self, mock_client, mock_limiter):
+        """All Brave queries go through one client; results keep query order."""
+        def handler(request):
+            query = request.url.params["q"]
+            if query == "bad":
+                return httpx.Response(429)
+            return httpx.Response(200, json={"web": {"results": [
+                {"url": f"http://{query}.com", "title": query, "description": "Body"},
+            ]}})
+        mock_client.return_value = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mock_limiter.wait_async = AsyncMock()
         
-        results = web_search(["query"])
+        results = _brave_search(["a", "bad", "b"])
         
-        mock_ddg.assert_called_once()
-        assert results[0]['href'] == "http://ddg.com"
+        mock_client.assert_called_once_with("fake_key")
+        assert [r['href'] for r in results] == ["http://a.com", "http://b.com"]
+        assert results[0]['body'] == "Body"